@@ -9,23 +9,52 @@ into mixins, and how the screen is redrawn after every change.
 from __future__ import annotations
 
 import curses
+import os
+import shutil
 import subprocess
-from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
 
 from nedok.colors import init_colors
 from nedok.file_operations import FileOperationsMixin
+from nedok.git_status import git_status_batch
 from nedok.git_operations import GitOperationsMixin
-from nedok.input_handlers import InputHandlersMixin
+from nedok.input_handlers import _NAVIGATION_ACTIONS, _QUIT_KEYS, InputHandlersMixin
 from nedok.modes import BrowserMode
 from nedok.render import render_browser
-from nedok.state import _PaneState
+from nedok.state import _PaneEntry, _PaneState, invalidate_listing_cache
 
 # Constants
 OUTPUT_BUFFER_MAX_LINES = 200
+COMMAND_POLL_INTERVAL_MS = 100  # getch timeout while a command or git task runs
+KEY_BURST_MAX = 64  # queued keys applied before the next repaint
+IDLE_REVALIDATE_INTERVAL_MS = 1000  # how often an idle browser checks for outside changes
+_UNHANDLED_KEY_MESSAGE = "Unhandled keypress."
 
 if TYPE_CHECKING:
-    from nedok.input_handlers import _PendingAction, _AvailableSSHCredentials
+    from nedok.input_handlers import (
+        _AvailableSSHCredentials,
+        _BackgroundTask,
+        _PendingAction,
+        _RunningCommand,
+    )
+
+
+def _resolve_program(name: str) -> str:
+    """Return the absolute path of ``name`` on ``PATH``, or ``name`` itself."""
+    return shutil.which(name) or name
+
+
+def _file_signature(path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    """Return ``(mtime_ns, size)`` for ``path``, or None if it cannot be read."""
+    if path is None:
+        return None
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
 
 
 class DualPaneBrowserError(Exception):
@@ -61,12 +90,31 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         self.mode: BrowserMode = BrowserMode.FILE
         self._stdscr: Optional["curses._CursesWindow"] = None  # type: ignore[name-defined]
 
+        # Console command running in the background (see _execute_command)
+        self.running_command: Optional["_RunningCommand"] = None
+        self.background_task: Optional["_BackgroundTask"] = None
+        # External programs, resolved once: our environment cannot change later.
+        self._editor: str = _resolve_program(os.environ.get("EDITOR", "vi"))
+        self._pager: str = _resolve_program(os.environ.get("PAGER", "less"))
+        # less needs -R to show git's colours instead of escape codes
+        self._pager_args: Tuple[str, ...] = (
+            ("-R",) if "less" in Path(self._pager).name.lower() else ()
+        )
+        # Set whenever state may have changed since the last repaint.
+        self._dirty: bool = True
+        # Scans the right pane while the left one is scanned on the UI thread;
+        # its worker thread starts on first use and is reused afterwards.
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="nedok-refresh"
+        )
+
         # Confirmation dialog state
         self.pending_action: Optional["_PendingAction"] = None
 
         # Rename mode state
         self.in_rename_mode: bool = False
         self.rename_buffer: str = ""
+        self.rename_target: Optional[_PaneEntry] = None
 
         # Create mode state
         self.in_create_mode: bool = False
@@ -169,8 +217,14 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         """Main curses event loop.
 
         ``curses.wrapper`` calls this method and passes in the configured screen
-        object.  Every iteration reads exactly one key press, dispatches it to
-        the appropriate handler, and then repaints the entire interface.
+        object.  Every iteration waits for a key press, dispatches it (plus any
+        keys already queued behind it) to the appropriate handler, and then
+        repaints the interface.  While a console command runs in the
+        background, the key read times out so its output keeps appearing
+        without user input; those wake-ups only repaint when the command
+        produced something new.  An idle browser also wakes up every
+        ``IDLE_REVALIDATE_INTERVAL_MS`` to pick up directories that other
+        programs changed.
         """
         self._stdscr = stdscr
         curses.curs_set(0)
@@ -181,46 +235,49 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         # Initialize colors
         init_colors()
 
-        for pane in (self.left, self.right):
-            self._refresh_pane(pane)
+        self._refresh_both_panes()
+
+        # Bound once: these are looked up on every iteration.
+        getch = stdscr.getch
+        set_timeout = stdscr.timeout
+        render = render_browser
+        poll_command = self._poll_running_command
+        poll_task = self._poll_background_task
+        dispatch_key = self._dispatch_key
 
         try:
             while True:
-                render_browser(self, stdscr)
-                key = stdscr.getch()
-
-                # Check if we're in any modal input mode where 'q' should be treated as regular input
-                in_modal_input = (
-                    self.in_command_mode or
-                    self.pending_action or
-                    self.in_ssh_connect_mode or
-                    self.in_rename_mode or
-                    self.in_create_mode or
-                    self.in_mode_prompt
+                if poll_command():
+                    self._dirty = True
+                if poll_task():
+                    self._dirty = True
+                if self._dirty:
+                    render(self, stdscr)
+                    self._dirty = False
+                # Wake up periodically while a command runs so its output and
+                # exit status appear without waiting for a key press, and
+                # otherwise now and then to notice changes made elsewhere.
+                set_timeout(
+                    COMMAND_POLL_INTERVAL_MS
+                    if self.running_command or self.background_task
+                    else IDLE_REVALIDATE_INTERVAL_MS
                 )
-
-                # Only quit if 'q' is pressed and we're not in any modal input mode
-                if key in (ord("q"), ord("Q")) and not in_modal_input:
+                key = getch()
+                if key == -1:
+                    if self._revalidate_panes():
+                        self._dirty = True
+                    continue
+                if self._wants_quit(key):
+                    break
+                if dispatch_key(key):
+                    self._dirty = True
+                if not self._dispatch_queued_keys(stdscr):
                     break
-
-                if self.pending_action:
-                    handled = self._handle_confirmation_key(key)
-                elif self.in_ssh_connect_mode:
-                    handled = self._handle_ssh_connect_key(key)
-                elif self.in_rename_mode:
-                    handled = self._handle_rename_key(key)
-                elif self.in_create_mode:
-                    handled = self._handle_create_key(key)
-                elif self.in_mode_prompt:
-                    handled = self._handle_mode_selection_key(key)
-                elif self.in_command_mode:
-                    handled = self._handle_command_key(key)
-                else:
-                    handled = self._handle_navigation_key(key)
-                if not handled and key not in (ord("q"), ord("Q")):
-                    self.status_message = "Unhandled keypress."
         finally:
             self._stdscr = None
+            self._refresh_executor.shutdown(wait=False)
+            if self.running_command is not None:
+                self.running_command.process.terminate()
 
         # Collect SSH connection info if present
         left_ssh = None
@@ -244,6 +301,75 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         right_dir = Path(self.right.current_dir) if not self.right.is_remote else Path.cwd()
         return left_dir, right_dir, left_ssh, right_ssh
 
+    def _dispatch_key(self, key: int) -> bool:
+        """Route one key press to the active handler.
+
+        Returns True if the key changed anything on screen.  Keys swallowed by
+        a confirmation or text prompt, and cursor moves past either end of the
+        list, return False so the main loop skips the repaint.
+        """
+        reports_unhandled = True
+        if self.pending_action:
+            changed = self._handle_confirmation_key(key)
+            reports_unhandled = False
+        elif self.in_ssh_connect_mode:
+            changed = self._handle_ssh_connect_key(key)
+        elif self.in_rename_mode:
+            changed = self._handle_rename_key(key)
+            reports_unhandled = False
+        elif self.in_create_mode:
+            changed = self._handle_create_key(key)
+            reports_unhandled = False
+        elif self.in_mode_prompt:
+            changed = self._handle_mode_selection_key(key)
+        elif self.in_command_mode:
+            changed = self._handle_command_key(key)
+            reports_unhandled = False
+        else:
+            changed = self._handle_navigation_key(key)
+            # Known keys that did nothing (a move at the list edge) are quiet.
+            reports_unhandled = key not in _NAVIGATION_ACTIONS
+        if not changed and reports_unhandled:
+            changed = self.status_message != _UNHANDLED_KEY_MESSAGE
+            self.status_message = _UNHANDLED_KEY_MESSAGE
+        return changed or key == curses.KEY_RESIZE
+
+    def _wants_quit(self, key: int) -> bool:
+        """Return True if ``key`` quits; prompts take q/Q as ordinary input."""
+        return key in _QUIT_KEYS and not self._in_modal_input()
+
+    def _in_modal_input(self) -> bool:
+        """Return True while a prompt or confirmation is capturing keys."""
+        return bool(
+            self.in_command_mode or
+            self.pending_action or
+            self.in_ssh_connect_mode or
+            self.in_rename_mode or
+            self.in_create_mode or
+            self.in_mode_prompt
+        )
+
+    def _dispatch_queued_keys(self, stdscr: "curses._CursesWindow") -> bool:  # type: ignore[name-defined]
+        """Apply keys that are already waiting before the next repaint.
+
+        Holding an arrow key or pasting text queues many key presses; handling
+        them together means the burst costs one frame instead of one per key.
+        Marks the frame dirty if any of them changed something and returns
+        False if one of them asked to quit.
+        """
+        stdscr.timeout(0)
+        getch = stdscr.getch
+        dispatch_key = self._dispatch_key
+        for _ in range(KEY_BURST_MAX):
+            key = getch()
+            if key == -1:
+                break
+            if self._wants_quit(key):
+                return False
+            if dispatch_key(key):
+                self._dirty = True
+        return True
+
     def _dismiss_overlays(self) -> None:
         """Dismiss help and mode selection overlays."""
         self.show_help = False
@@ -260,11 +386,19 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         if len(self.console_buffer) > OUTPUT_BUFFER_MAX_LINES:
             self.console_buffer = self.console_buffer[-OUTPUT_BUFFER_MAX_LINES:]
 
-    def _run_external(self, command: List[str]) -> None:
-        """Temporarily suspend curses to run an external command."""
+    def _run_external(self, command: List[str], *, edited: Optional[Path] = None) -> None:
+        """Temporarily suspend curses to run an external command.
+
+        Afterwards only panes whose directory changed are rescanned, plus the
+        panes showing ``edited`` when the command modified that local file
+        (an in-place save does not touch the directory's mtime).  The screen
+        is restored by the main loop's next frame rather than a separate
+        ``refresh``, so the terminal is repainted once instead of twice.
+        """
         if self._stdscr is None:
             self.status_message = "Cannot run external command."
             return
+        edited_before = _file_signature(edited)
         curses.endwin()
         try:
             subprocess.run(command, check=False)
@@ -284,11 +418,15 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         except (OSError, subprocess.SubprocessError) as err:
             self.status_message = f"Command failed: {err}"
         finally:
-            self._stdscr.refresh()
             self.show_help = False
             self.in_mode_prompt = False
-            for pane in (self.left, self.right):
-                self._refresh_pane(pane)
+            edited_changed = edited is not None and _file_signature(edited) != edited_before
+            self._rescan_panes([
+                pane
+                for pane in (self.left, self.right)
+                if pane.listing_is_stale()
+                or (edited_changed and self._pane_is_affected(pane, (edited,)))
+            ])
 
     def _refresh_pane(self, pane: _PaneState) -> None:
         """Refresh a single pane, enabling tree mode when appropriate."""
@@ -299,20 +437,127 @@ class DualPaneBrowser(InputHandlersMixin, FileOperationsMixin, GitOperationsMixi
         )
         pane.refresh_entries(self.mode)
 
-    def _refresh_panes(self) -> None:
-        """Refresh both panes to reflect filesystem changes."""
-        for pane in (self.left, self.right):
-            self._refresh_pane(pane)
+    def _refresh_panes(self, *changed_paths: Union[Path, str]) -> None:
+        """Refresh panes to reflect filesystem changes.
 
-    @property
-    def _active_pane(self) -> _PaneState:
-        """Get the currently active pane."""
-        return self.left if self.active_index == 0 else self.right
+        With no arguments both panes are refreshed.  Callers that know which
+        paths they modified pass them in, and only panes that can show one of
+        those paths (or whose directory sits inside one) are rescanned.
+        Cached listings are dropped first: edits inside a directory do not
+        always change its mtime.
+        """
+        panes = [
+            pane
+            for pane in (self.left, self.right)
+            if not changed_paths or self._pane_is_affected(pane, changed_paths)
+        ]
+        self._rescan_panes(panes)
+
+    def _revalidate_panes(self) -> bool:
+        """Rescan panes whose directory changed behind our back.
+
+        Costs one ``stat`` per local pane, so it is cheap enough to run
+        whenever the loop is idle.  Nothing is rescanned while a prompt or
+        confirmation is open, so the listing it refers to stays put.
+        Returns True if any pane was refreshed.
+        """
+        if self._in_modal_input():
+            return False
+        stale = [pane for pane in (self.left, self.right) if pane.listing_is_stale()]
+        for pane in stale:
+            try:
+                self._refresh_pane(pane)
+            except (PermissionError, FileNotFoundError) as err:
+                self.status_message = str(err)
+        return bool(stale)
+
+    def _drop_deleted_entry(self, path: Union[Path, str]) -> None:
+        """Update the panes after ``path`` was deleted.
+
+        A pane listing the directory that contained ``path`` simply loses
+        that row.  Panes that need more than that still get a rescan: tree
+        views (the row may have children), git mode (statuses of the
+        remaining rows may change) and panes that were inside ``path``.
+        """
+        panes = [
+            pane
+            for pane in (self.left, self.right)
+            if self._pane_is_affected(pane, (path,))
+            and (
+                self.mode is BrowserMode.GIT
+                or pane.tree_mode_enabled
+                or not pane.remove_entry(path)
+            )
+        ]
+        self._rescan_panes(panes)
+
+    def _rescan_panes(self, panes: List[_PaneState]) -> None:
+        """Drop cached listings for ``panes`` and read them again."""
+        if not panes:
+            return
+        invalidate_listing_cache(*(pane.current_dir for pane in panes))
+        if len(panes) == 2:
+            self._refresh_both_panes()
+        else:
+            self._refresh_pane(panes[0])
+
+    @staticmethod
+    def _pane_is_affected(pane: _PaneState, changed_paths: Tuple[Union[Path, str], ...]) -> bool:
+        """Return True if a change to any of ``changed_paths`` is visible in ``pane``.
+
+        Remote entries carry ``str`` paths and local ones ``Path`` objects, so
+        the type tells which kind of pane a path can belong to.
+        """
+        if pane.is_remote:
+            current = PurePosixPath(str(pane.current_dir))
+            candidates = [PurePosixPath(path) for path in changed_paths if isinstance(path, str)]
+        else:
+            current = Path(pane.current_dir)
+            candidates = [path for path in changed_paths if isinstance(path, Path)]
+        for path in candidates:
+            # The pane lists the path (or an ancestor of it in tree mode), or
+            # the pane's own directory was inside what changed.
+            if current in path.parents or current == path or path in current.parents:
+                return True
+        return False
+
+    def _refresh_both_panes(self) -> None:
+        """Refresh the left and right panes concurrently.
+
+        Directory scans and ``stat`` calls release the GIL, so the right pane
+        is scanned on a worker thread while the left one is scanned here.  On
+        slow filesystems (NFS, FUSE, SSH) this hides one pane's latency behind
+        the other.  When both panes show the same directory the second refresh
+        is served from the listing cache, so it simply runs afterwards.  In
+        git mode, panes inside the same repository share one ``git status``.
+        """
+        with git_status_batch():
+            if self.left.current_dir == self.right.current_dir:
+                self._refresh_pane(self.left)
+                self._refresh_pane(self.right)
+                return
+            right_refresh = self._refresh_executor.submit(self._refresh_pane, self.right)
+            try:
+                self._refresh_pane(self.left)
+            finally:
+                right_refresh.result()
 
     @property
-    def _inactive_pane(self) -> _PaneState:
-        """Get the currently inactive pane."""
-        return self.right if self.active_index == 0 else self.left
+    def active_index(self) -> int:
+        """Index of the active pane: 0 for left, 1 for right.
+
+        Setting it also updates ``_active_pane`` and ``_inactive_pane``, which
+        are plain attributes because they are read by nearly every handler.
+        """
+        return self._active_index
+
+    @active_index.setter
+    def active_index(self, index: int) -> None:
+        self._active_index = index
+        if index == 0:
+            self._active_pane, self._inactive_pane = self.left, self.right
+        else:
+            self._active_pane, self._inactive_pane = self.right, self.left
 
 
 __all__ = ["DualPaneBrowser", "DualPaneBrowserError"]
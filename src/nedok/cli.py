@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -202,7 +203,15 @@ def main() -> int:
         final_left, final_right, final_left_ssh, final_right_ssh = browser.browse()
 
         # 5) Persist the ending state so the next run can resume effortlessly.
-        save_session(str(final_left), str(final_right), final_left_ssh, final_right_ssh)
+        # The file is written on a background thread so the summary below
+        # appears straight away, even when the home directory is on slow
+        # storage.  The thread is not a daemon: Python waits for it to finish
+        # before the process exits, so the session is never lost.
+        threading.Thread(
+            target=save_session,
+            args=(str(final_left), str(final_right), final_left_ssh, final_right_ssh),
+            name="nedok-save-session",
+        ).start()
 
         print(f"Final left pane directory: {final_left}")
         if final_left_ssh:
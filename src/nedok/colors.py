@@ -11,6 +11,7 @@ from __future__ import annotations
 import curses
 from enum import IntEnum
 from pathlib import Path, PurePosixPath
+from typing import Dict
 
 from nedok.config import get_dialog_colors
 
@@ -46,31 +47,49 @@ COLOR_NAME_TO_CURSES = {
 }
 
 
+# Foreground of each fixed pair; all of them use the terminal's background.
+# 8 is bright black (gray) where the terminal has it.
+_PAIR_FOREGROUNDS = (
+    # File mode colors
+    (ColorPair.DIRECTORY, curses.COLOR_BLUE),
+    (ColorPair.EXECUTABLE, curses.COLOR_GREEN),
+    (ColorPair.SYMLINK, curses.COLOR_CYAN),
+    (ColorPair.HIDDEN, 8),
+    (ColorPair.READONLY, curses.COLOR_YELLOW),
+    # Git mode colors
+    (ColorPair.GIT_UNTRACKED, curses.COLOR_RED),
+    (ColorPair.GIT_MODIFIED, curses.COLOR_YELLOW),
+    (ColorPair.GIT_STAGED, curses.COLOR_GREEN),
+    (ColorPair.GIT_DELETED, curses.COLOR_RED),
+    (ColorPair.GIT_RENAMED, curses.COLOR_CYAN),
+    (ColorPair.GIT_CLEAN, 8),
+)
+
+# Pairs drawn in bold wherever they are used.
+_BOLD_PAIRS = frozenset(
+    {ColorPair.DIRECTORY, ColorPair.EXECUTABLE, ColorPair.GIT_UNTRACKED, ColorPair.GIT_STAGED}
+)
+
+# Final attribute for each pair, filled in by init_colors().  Until then (and
+# on terminals without colour) every pair renders as plain text, so the
+# lookup helpers below never need to ask curses.
+_pair_attrs: Dict[ColorPair, int] = dict.fromkeys(ColorPair, curses.A_NORMAL)
+
+
 def init_colors() -> None:
     """Initialize curses color pairs.
 
     Call this after curses initialization and before rendering.
     """
     if not curses.has_colors():
+        _pair_attrs.update(dict.fromkeys(ColorPair, curses.A_NORMAL))
         return
 
     curses.start_color()
     curses.use_default_colors()
 
-    # File mode colors
-    curses.init_pair(ColorPair.DIRECTORY, curses.COLOR_BLUE, -1)
-    curses.init_pair(ColorPair.EXECUTABLE, curses.COLOR_GREEN, -1)
-    curses.init_pair(ColorPair.SYMLINK, curses.COLOR_CYAN, -1)
-    curses.init_pair(ColorPair.HIDDEN, 8, -1)  # Bright black (gray) if available
-    curses.init_pair(ColorPair.READONLY, curses.COLOR_YELLOW, -1)
-
-    # Git mode colors
-    curses.init_pair(ColorPair.GIT_UNTRACKED, curses.COLOR_RED, -1)
-    curses.init_pair(ColorPair.GIT_MODIFIED, curses.COLOR_YELLOW, -1)
-    curses.init_pair(ColorPair.GIT_STAGED, curses.COLOR_GREEN, -1)
-    curses.init_pair(ColorPair.GIT_DELETED, curses.COLOR_RED, -1)
-    curses.init_pair(ColorPair.GIT_RENAMED, curses.COLOR_CYAN, -1)
-    curses.init_pair(ColorPair.GIT_CLEAN, 8, -1)  # Dim
+    for pair, foreground in _PAIR_FOREGROUNDS:
+        curses.init_pair(pair, foreground, -1)
     dialog_colors = get_dialog_colors()
     fg_name = dialog_colors.get("foreground", "black").lower()
     bg_name = dialog_colors.get("background", "cyan").lower()
@@ -78,6 +97,12 @@ def init_colors() -> None:
     bg = COLOR_NAME_TO_CURSES.get(bg_name, curses.COLOR_CYAN)
     curses.init_pair(ColorPair.DIALOG, fg, bg)
 
+    for pair in ColorPair:
+        attr = curses.color_pair(pair)
+        if pair in _BOLD_PAIRS:
+            attr |= curses.A_BOLD
+        _pair_attrs[pair] = attr
+
 
 def _get_filename(entry: "PaneEntry") -> str:  # type: ignore[name-defined]
     """Get the filename from an entry, handling both local and remote paths.
@@ -103,33 +128,28 @@ def get_file_color(entry: "PaneEntry") -> int:  # type: ignore[name-defined]
     Returns:
         curses color pair number and attributes
     """
-    if not curses.has_colors():
-        return curses.A_NORMAL
-
-    # Parent directory
-    if entry.is_parent:
-        return curses.color_pair(ColorPair.DIRECTORY) | curses.A_BOLD
+    attrs = _pair_attrs
 
-    # Directories
-    if entry.is_dir:
-        return curses.color_pair(ColorPair.DIRECTORY) | curses.A_BOLD
+    # Parent directory and directories
+    if entry.is_parent or entry.is_dir:
+        return attrs[ColorPair.DIRECTORY]
 
     # Symlinks
     if entry.is_symlink:
-        return curses.color_pair(ColorPair.SYMLINK)
+        return attrs[ColorPair.SYMLINK]
 
     # Hidden files (dotfiles)
     filename = _get_filename(entry)
     if filename.startswith('.'):
-        return curses.color_pair(ColorPair.HIDDEN)
+        return attrs[ColorPair.HIDDEN]
 
     # Executables
     if entry.is_executable:
-        return curses.color_pair(ColorPair.EXECUTABLE) | curses.A_BOLD
+        return attrs[ColorPair.EXECUTABLE]
 
     # Read-only files
     if entry.is_readonly:
-        return curses.color_pair(ColorPair.READONLY)
+        return attrs[ColorPair.READONLY]
 
     # Regular files
     return curses.A_NORMAL
@@ -144,42 +164,52 @@ def get_git_color(entry: "PaneEntry") -> int:  # type: ignore[name-defined]
     Returns:
         curses color pair number and attributes
     """
-    if not curses.has_colors():
-        return curses.A_NORMAL
-
-    # Parent directory - always show as directory
-    if entry.is_parent:
-        return curses.color_pair(ColorPair.DIRECTORY) | curses.A_BOLD
+    attrs = _pair_attrs
 
-    # Directories - show as directory color
-    if entry.is_dir:
-        return curses.color_pair(ColorPair.DIRECTORY) | curses.A_BOLD
+    # Parent directory and directories - always show as directory
+    if entry.is_parent or entry.is_dir:
+        return attrs[ColorPair.DIRECTORY]
 
-    # Check git status
     status = entry.git_status or ""
+    pair = _GIT_STATUS_PAIRS.get(status)
+    if pair is None:
+        pair = _git_status_pair(status)
+    return attrs[pair]
 
+
+def _git_status_pair(status: str) -> ColorPair:
+    """Return the colour pair for a porcelain ``XY`` status code."""
     # Untracked files
     if status == "??":
-        return curses.color_pair(ColorPair.GIT_UNTRACKED) | curses.A_BOLD
+        return ColorPair.GIT_UNTRACKED
 
     # Deleted files
     if "D" in status:
-        return curses.color_pair(ColorPair.GIT_DELETED)
+        return ColorPair.GIT_DELETED
 
     # Renamed files
     if "R" in status:
-        return curses.color_pair(ColorPair.GIT_RENAMED)
+        return ColorPair.GIT_RENAMED
 
     # Staged changes (left column has change)
     if status and status[0] != " " and status[0] != "?":
-        return curses.color_pair(ColorPair.GIT_STAGED) | curses.A_BOLD
+        return ColorPair.GIT_STAGED
 
     # Modified but not staged (right column has change)
     if status and len(status) > 1 and status[1] != " ":
-        return curses.color_pair(ColorPair.GIT_MODIFIED)
+        return ColorPair.GIT_MODIFIED
 
     # Clean/unmodified files - dim them
-    return curses.color_pair(ColorPair.GIT_CLEAN)
+    return ColorPair.GIT_CLEAN
+
+
+# Every status code git can report is two letters from this alphabet, so the
+# pair for each is worked out once here instead of per row.
+_GIT_STATUS_LETTERS = " MTADRCU?!"
+_GIT_STATUS_PAIRS: Dict[str, ColorPair] = {
+    status: _git_status_pair(status)
+    for status in [""] + [x + y for x in _GIT_STATUS_LETTERS for y in _GIT_STATUS_LETTERS]
+}
 
 
 __all__ = ["ColorPair", "init_colors", "get_file_color", "get_git_color"]
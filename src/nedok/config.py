@@ -8,10 +8,9 @@ functions expose specific sections (colours, SSH credentials, session data).
 
 from __future__ import annotations
 
-import copy
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import tomllib  # Python 3.11+
@@ -74,23 +73,44 @@ COLOR_MAP = {
 }
 
 
+# Parsed configuration keyed by (path, mtime_ns, size, inode) of the file it
+# came from.  SSH prompts and session handling call load_config() repeatedly;
+# an unchanged file then costs one stat() instead of an open and a TOML parse.
+_config_cache: Optional[Tuple[Tuple[str, int, int, int], Dict[str, Any]]] = None
+
+
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file or return defaults."""
-    if not CONFIG_FILE.exists():
-        return copy.deepcopy(DEFAULT_CONFIG)
+    """Load configuration from file or return defaults.
+
+    Each call returns a fresh copy, so callers may modify the result.
+    """
+    global _config_cache
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
+        return _copy_config(DEFAULT_CONFIG)
+
+    key = (str(CONFIG_FILE), st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _config_cache
+    if cached is not None and cached[0] == key:
+        return _copy_config(cached[1])
 
     try:
-        with open(CONFIG_FILE, "rb") as f:
-            config = tomllib.load(f)
+        config = tomllib.loads(CONFIG_FILE.read_bytes().decode("utf-8"))
         # Merge with defaults to ensure all keys exist
-        return _merge_config(DEFAULT_CONFIG, config)
+        merged = _merge_config(DEFAULT_CONFIG, config)
     except Exception:
         # If config is corrupted, return defaults
-        return copy.deepcopy(DEFAULT_CONFIG)
+        return _copy_config(DEFAULT_CONFIG)
+    _config_cache = (key, merged)
+    return _copy_config(merged)
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
+    global _config_cache
+    # A rewrite within the timestamp granularity can keep mtime and size.
+    _config_cache = None
     try:
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
         with open(CONFIG_FILE, "wb") as f:
@@ -100,14 +120,38 @@ def save_config(config: Dict[str, Any]) -> None:
         print(f"Warning: Failed to save configuration to {CONFIG_FILE}: {err}", file=sys.stderr)
 
 
+def _copy_config(value: Any) -> Any:
+    """Return a copy of ``value`` whose tables and arrays can be modified.
+
+    TOML only produces dicts, lists and immutable scalars, so copying the
+    containers is enough and much cheaper than :func:`copy.deepcopy`.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
 def _merge_config(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge user config with defaults, preserving user values."""
-    result = copy.deepcopy(default)
-    for key, value in user.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_config(result[key], value)
+    """Merge user config with defaults, preserving user values.
+
+    Each default is copied only where the user did not override it, so every
+    part of the tree is visited once.
+    """
+    result: Dict[str, Any] = {}
+    for key, default_value in default.items():
+        if key not in user:
+            result[key] = _copy_config(default_value)
+            continue
+        value = user[key]
+        if isinstance(default_value, dict) and isinstance(value, dict):
+            result[key] = _merge_config(default_value, value)
         else:
             result[key] = value
+    for key, value in user.items():
+        if key not in default:
+            result[key] = value
     return result
 
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import errno
+import fcntl
 import os
 import shutil
+import stat
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
@@ -14,6 +17,46 @@ if TYPE_CHECKING:
     from .ssh_connection import SSHConnection
 
 
+# ioctl request asking the filesystem to share one file's extents with
+# another (a reflink); _IOW(0x94, 9, int) in linux/fs.h.
+FICLONE = 0x40049409
+
+
+class _FileCloner:
+    """``copy_function`` for :mod:`shutil` that tries a reflink first.
+
+    Copy-on-write filesystems (btrfs, XFS) clone a file without reading or
+    writing its data.  Elsewhere the ioctl is refused, and after the first
+    refusal the instance copies the rest of the tree with ``shutil.copy2``.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = True
+
+    def __call__(self, source: str, destination: str) -> str:
+        if self.enabled and self._clone(source, destination):
+            shutil.copystat(source, destination)
+            return destination
+        return shutil.copy2(source, destination)
+
+    def _clone(self, source: str, destination: str) -> bool:
+        try:
+            # Only regular files can be cloned; opening a FIFO would block.
+            # Everything else goes to shutil.copy2, which rejects it.
+            if not stat.S_ISREG(os.stat(source).st_mode):
+                return False
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                except OSError:
+                    self.enabled = False
+                    return False
+        except OSError:
+            # Let shutil.copy2 report problems opening either file.
+            return False
+        return True
+
+
 @dataclass
 class _DestinationInfo:
     path: Union[Path, str]
@@ -40,12 +83,14 @@ class FileOperationsMixin:
             return
 
         entry_name = self._get_entry_name(entry)
+        # Captured now so confirming acts on this entry and pane even if the
+        # listing changes while the prompt is open.
+        pane = self._active_pane
 
         def do_delete() -> None:
             try:
                 if entry.is_remote:
                     # Remote delete
-                    pane = self._active_pane
                     if not pane.ssh_connection:
                         self.status_message = "No SSH connection."
                         return
@@ -65,7 +110,9 @@ class FileOperationsMixin:
                     self.status_message = f"Deleted {entry_name}."
             except (OSError, PermissionError, shutil.Error, IOError) as err:
                 self.status_message = f"Delete failed: {err}"
-            self._refresh_panes()
+                self._refresh_panes(entry.path)
+                return
+            self._drop_deleted_entry(entry.path)
 
         self._request_confirmation(f"Delete {entry_name}?", do_delete)
 
@@ -158,14 +205,15 @@ class FileOperationsMixin:
             operation_present="Move",
             operation_past="Moved",
             post_copy=delete_source,
+            try_rename=True,
         )
 
     def _copy_local_to_local(self, entry: "_PaneEntry", dest_path: Path) -> None:
         """Copy from local to local."""
         if entry.is_dir:
-            shutil.copytree(str(entry.path), str(dest_path))
+            shutil.copytree(str(entry.path), str(dest_path), copy_function=_FileCloner())
         else:
-            shutil.copy2(str(entry.path), str(dest_path))
+            _FileCloner()(str(entry.path), str(dest_path))
 
     def _copy_remote_to_local(self, entry: "_PaneEntry", dest_path: Path) -> None:
         """Copy from remote to local via SFTP."""
@@ -222,6 +270,7 @@ class FileOperationsMixin:
         operation_past: str,
         overwrite: bool = False,
         post_copy: Optional[Callable[[], None]] = None,
+        try_rename: bool = False,
     ) -> None:
         try:
             dest_info = self._resolve_destination_info(entry_name)
@@ -243,6 +292,7 @@ class FileOperationsMixin:
                     operation_past=operation_past,
                     overwrite=True,
                     post_copy=post_copy,
+                    try_rename=try_rename,
                 ),
                 cancel_message=f"{operation_present} cancelled.",
             )
@@ -253,16 +303,33 @@ class FileOperationsMixin:
             if dest_info.exists and overwrite:
                 self._remove_destination(dest_info)
 
-            self._execute_copy(entry, dest_info)
+            if not (try_rename and self._rename_local(entry, dest_info)):
+                self._execute_copy(entry, dest_info)
 
-            if post_copy:
-                post_copy()
+                if post_copy:
+                    post_copy()
 
             self.status_message = f"{operation_past} {entry_name}."
-            self._refresh_panes()
+            self._refresh_panes(entry.path, dest_info.path)
         except (OSError, PermissionError, shutil.Error, IOError) as err:
             self.status_message = f"{operation_present} failed: {err}"
 
+    def _rename_local(self, entry: "_PaneEntry", dest_info: _DestinationInfo) -> bool:
+        """Move a local entry with a single rename when both ends allow it.
+
+        Returns False when either side is remote or the rename would cross
+        filesystems, leaving the caller to copy and delete instead.
+        """
+        if entry.is_remote or dest_info.is_remote:
+            return False
+        try:
+            os.replace(entry.path, dest_info.path)
+        except OSError as err:
+            if err.errno == errno.EXDEV:
+                return False
+            raise
+        return True
+
     def _execute_copy(self, entry: "_PaneEntry", dest_info: _DestinationInfo) -> None:
         """Perform the actual copy based on source/destination types."""
         dest_path = dest_info.path
@@ -320,7 +387,7 @@ class FileOperationsMixin:
             return str(entry.path) == str(dest_info.path)
 
         try:
-            source_path = Path(entry.path).resolve()
+            source_path = entry.resolved_path
             dest_path = Path(dest_info.path).resolve()
         except OSError:
             return False
@@ -419,7 +486,7 @@ class FileOperationsMixin:
             self.status_message = "Select a file to view."
             return
 
-        viewer = os.environ.get("PAGER", "less")
+        viewer = self._pager
 
         if entry.is_remote:
             # Download to temp file and view
@@ -459,7 +526,7 @@ class FileOperationsMixin:
             self.status_message = "Select a file to edit."
             return
 
-        editor = os.environ.get("EDITOR", "vi")
+        editor = self._editor
 
         if entry.is_remote:
             # Download to temp file, edit, upload back
@@ -491,7 +558,7 @@ class FileOperationsMixin:
                     # Upload modified file back
                     pane.ssh_connection.put_file(tmp_path, str(entry.path))
                     self.status_message = f"Uploaded changes to {entry_name}."
-                    self._refresh_panes()
+                    self._refresh_panes(entry.path)
                 else:
                     self.status_message = "No changes made."
 
@@ -504,7 +571,7 @@ class FileOperationsMixin:
                 self.status_message = f"Edit failed: {err}"
         else:
             # Local file
-            self._run_external([editor, str(entry.path)])
+            self._run_external([editor, str(entry.path)], edited=Path(entry.path))
 
     def _start_rename(self) -> None:
         """Start rename mode for the selected entry."""
@@ -514,20 +581,24 @@ class FileOperationsMixin:
             return
 
         self.in_rename_mode = True
+        self.rename_target = entry
         self.rename_buffer = self._get_entry_name(entry)
         self.status_message = "Enter new name (Enter to confirm, Esc to cancel):"
 
     def _execute_rename(self) -> None:
         """Perform the rename operation."""
         new_name = self.rename_buffer.strip()
+        entry = self.rename_target
         self.in_rename_mode = False
         self.rename_buffer = ""
+        self.rename_target = None
 
         if not new_name:
             self.status_message = "Rename cancelled (empty name)."
             return
 
-        entry = self._active_pane.selected_entry()
+        # Act on the entry chosen when renaming started, not whatever row
+        # the cursor is on now.
         if entry is None:
             return
 
@@ -549,19 +620,20 @@ class FileOperationsMixin:
 
                 pane.ssh_connection.rename(str(old_path), str(new_path))
                 self.status_message = f"Renamed to '{new_name}'."
+                self._refresh_panes(str(old_path), str(new_path))
             else:
-                # Local rename
+                # Local rename.  rename(2) silently replaces an existing
+                # target, so the check cannot be folded into the call.
                 old_path = Path(entry.path)
                 new_path = old_path.parent / new_name
 
-                if new_path.exists():
+                if os.path.lexists(new_path):
                     self.status_message = f"'{new_name}' already exists."
                     return
 
-                old_path.rename(new_path)
+                os.rename(old_path, new_path)
                 self.status_message = f"Renamed to '{new_name}'."
-
-            self._refresh_panes()
+                self._refresh_panes(old_path, new_path)
         except (OSError, PermissionError, IOError) as err:
             self.status_message = f"Rename failed: {err}"
 
@@ -614,21 +686,24 @@ class FileOperationsMixin:
                         pass
                     self.status_message = f"Created file '{name}'."
             else:
-                # Local create
+                # Local create; both calls fail if the name is already taken,
+                # so there is no separate existence check to race against.
                 target = Path(pane.current_dir) / name
 
-                if target.exists():
+                try:
+                    if self.create_is_dir:
+                        os.makedirs(target)
+                    else:
+                        os.close(os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+                except FileExistsError:
                     self.status_message = f"'{name}' already exists."
                     return
-
                 if self.create_is_dir:
-                    target.mkdir(parents=True)
                     self.status_message = f"Created directory '{name}'."
                 else:
-                    target.touch()
                     self.status_message = f"Created file '{name}'."
 
-            self._refresh_panes()
+            self._refresh_panes(target)
         except (OSError, PermissionError, IOError) as err:
             self.status_message = f"Create failed: {err}"
 
@@ -5,19 +5,25 @@ from __future__ import annotations
 from datetime import datetime
 
 
+_SIZE_UNITS = ("B", "K", "M", "G", "T", "P", "E", "Z", "Y")
+
+
 def format_size(size: int) -> str:
     """Convert a byte count into a friendly string such as ``12.4K``."""
-    units = ["B", "K", "M", "G", "T", "P", "E", "Z", "Y"]
-    value = float(size)
-    index = 0
-    while value >= 1024 and index < len(units) - 1:
-        value /= 1024
-        index += 1
-    unit = units[index]
-    if unit == "B":
-        return f"{int(value)}{unit}"
-    formatted = f"{value:.1f}".rstrip("0").rstrip(".")
-    return f"{formatted}{unit}"
+    # Each unit is 2**10 of the previous one, so the bit length picks the
+    # unit directly and the value is scaled with integer arithmetic only.
+    index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if index == 0:
+        return f"{size}B"
+    divisor = 1 << (10 * index)
+    tenths, remainder = divmod(size * 10, divisor)
+    # Round half to even, matching the ``.1f`` formatting this replaced.
+    if remainder * 2 > divisor or (remainder * 2 == divisor and tenths & 1):
+        tenths += 1
+    whole, fraction = divmod(tenths, 10)
+    if fraction:
+        return f"{whole}.{fraction}{_SIZE_UNITS[index]}"
+    return f"{whole}{_SIZE_UNITS[index]}"
 
 
 def format_timestamp(timestamp: datetime) -> str:
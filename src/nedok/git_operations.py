@@ -4,14 +4,31 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Callable, List, Tuple
+
+from nedok.git_status import find_repo_root, run_git
+from nedok.input_handlers import _BackgroundTask
 
 if TYPE_CHECKING:
     from .state import _PaneEntry
 
 
+def _memfd_pager_available() -> bool:
+    """Return True if a pager can open a memfd through ``/proc``.
+
+    ``memfd_create`` existing does not mean ``/proc`` is mounted; chroots
+    and minimal containers often lack it.
+    """
+    return (
+        sys.platform.startswith("linux")
+        and hasattr(os, "memfd_create")
+        and os.path.isdir("/proc/self/fd")
+    )
+
+
 class GitOperationsMixin:
     """Mixin providing git operations (stage, commit, diff, log, blame, restore)."""
 
@@ -28,7 +45,7 @@ class GitOperationsMixin:
         rel_str = str(relative_path)
         if self._run_git_command(repo_root, ["add", "--", rel_str]):
             self.status_message = f"Staged {rel_str}."
-            self._refresh_panes()
+            self._refresh_panes(entry.path)
 
     def _git_unstage_entry(self) -> None:
         """Remove the selected item from the staging area."""
@@ -46,7 +63,7 @@ class GitOperationsMixin:
         rel_str = str(relative_path)
         if self._run_git_command(repo_root, ["restore", "--staged", "--", rel_str]):
             self.status_message = f"Unstaged {rel_str}."
-            self._refresh_panes()
+            self._refresh_panes(entry.path)
 
     def _git_restore_entry(self) -> None:
         """Prompt the user before resetting a file back to ``HEAD``."""
@@ -66,7 +83,7 @@ class GitOperationsMixin:
                 ["restore", "--worktree", "--source=HEAD", "--", rel_str],
             ):
                 self.status_message = f"Restored {rel_str} to HEAD."
-                self._refresh_panes()
+                self._refresh_panes(entry.path)
 
         self._request_confirmation(f"Restore {entry.path.name} to HEAD?", do_restore)
 
@@ -88,7 +105,6 @@ class GitOperationsMixin:
         # Build diff command
         if entry.git_status == "??":
             command = [
-                "git",
                 "-C",
                 str(repo_root),
                 "diff",
@@ -100,7 +116,6 @@ class GitOperationsMixin:
             ]
         else:
             command = [
-                "git",
                 "-C",
                 str(repo_root),
                 "diff",
@@ -110,15 +125,7 @@ class GitOperationsMixin:
                 rel_str,
             ]
 
-        try:
-            # Create the diff
-            diff_result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
+        def show_diff(diff_result: subprocess.CompletedProcess) -> None:
             if diff_result.returncode not in (0, 1):
                 err_text = diff_result.stderr.strip() or "unknown error"
                 self.status_message = f"Git diff failed: {err_text}"
@@ -128,51 +135,26 @@ class GitOperationsMixin:
                 self.status_message = f"No differences for {rel_str}."
                 return
 
-            # Write to temp file and open in pager
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.diff', delete=False) as f:
-                f.write(diff_result.stdout)
-                temp_path = f.name
-
-            try:
-                pager = os.environ.get("PAGER", "less")
-                # Add -R flag for less to handle ANSI color codes
-                if "less" in pager.lower():
-                    pager_command = [pager, "-R", temp_path]
-                else:
-                    pager_command = [pager, temp_path]
-                self._run_external(pager_command)
-            finally:
-                Path(temp_path).unlink(missing_ok=True)
+            self._show_in_pager(diff_result.stdout, ".diff", "Git diff")
 
-        except OSError as err:
-            self.status_message = f"Git diff failed: {err}"
+        self._capture_git_output(command, "Git diff", show_diff)
 
     def _git_commit(self) -> None:
         """Create a git commit."""
-        # Get repo root
+        # Get repo root (cached across calls by find_repo_root)
         try:
-            result = subprocess.run(
-                ["git", "-C", str(self._active_pane.current_dir), "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            repo_root = find_repo_root(Path(self._active_pane.current_dir))
         except OSError as err:
             self.status_message = f"Git not available: {err}"
             return
 
-        if result.returncode != 0:
+        if repo_root is None:
             self.status_message = "Not in a git repository."
             return
 
-        repo_root = Path(result.stdout.strip())
-
         # Check if there are staged changes
         try:
-            status_result = subprocess.run(
-                ["git", "-C", str(repo_root), "diff", "--cached", "--quiet"],
-                check=False,
-            )
+            status_result = run_git(["-C", str(repo_root), "diff", "--cached", "--quiet"])
             if status_result.returncode == 0:
                 self.status_message = "No staged changes to commit."
                 return
@@ -180,7 +162,7 @@ class GitOperationsMixin:
             pass
 
         # Open editor for commit message
-        editor = os.environ.get("EDITOR", "vi")
+        editor = self._editor
         with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
             f.write("\n# Enter commit message above this line\n")
             f.write("# Changes to be committed:\n")
@@ -201,16 +183,15 @@ class GitOperationsMixin:
                 return
 
             # Execute commit
-            result = subprocess.run(
-                ["git", "-C", str(repo_root), "commit", "-m", commit_msg],
+            result = run_git(
+                ["-C", str(repo_root), "commit", "-m", commit_msg],
                 capture_output=True,
                 text=True,
-                check=False,
             )
 
             if result.returncode == 0:
                 self.status_message = "Commit created successfully."
-                self._refresh_panes()
+                self._refresh_panes(repo_root)
             else:
                 self.status_message = f"Commit failed: {result.stderr.strip()}"
 
@@ -233,23 +214,14 @@ class GitOperationsMixin:
         repo_root, relative_path = context
         rel_str = str(relative_path)
 
-        pager = os.environ.get("PAGER", "less")
         command = [
-            "git", "-C", str(repo_root),
+            "-C", str(repo_root),
             "log", "--oneline", "--decorate", "--color=always",
             "-n", "100",  # Last 100 commits
             "--", rel_str
         ]
 
-        try:
-            # Run git log and capture output
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
+        def show_log(result: subprocess.CompletedProcess) -> None:
             if result.returncode != 0:
                 self.status_message = f"Git log failed: {result.stderr.strip()}"
                 return
@@ -258,23 +230,9 @@ class GitOperationsMixin:
                 self.status_message = f"No commits found for {rel_str}."
                 return
 
-            # Write to temp file and open in pager
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-                f.write(result.stdout)
-                temp_path = f.name
+            self._show_in_pager(result.stdout, ".log", "Git log")
 
-            try:
-                # Add -R flag for less to handle ANSI color codes
-                if "less" in pager.lower():
-                    pager_command = [pager, "-R", temp_path]
-                else:
-                    pager_command = [pager, temp_path]
-                self._run_external(pager_command)
-            finally:
-                Path(temp_path).unlink(missing_ok=True)
-
-        except OSError as err:
-            self.status_message = f"Git log failed: {err}"
+        self._capture_git_output(command, "Git log", show_log)
 
     def _git_blame_entry(self) -> None:
         """Show git blame for selected file."""
@@ -290,21 +248,12 @@ class GitOperationsMixin:
         repo_root, relative_path = context
         rel_str = str(relative_path)
 
-        pager = os.environ.get("PAGER", "less")
         command = [
-            "git", "-C", str(repo_root),
+            "-C", str(repo_root),
             "blame", "--color-by-age", rel_str
         ]
 
-        try:
-            # Run git blame and capture output
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
+        def show_blame(result: subprocess.CompletedProcess) -> None:
             if result.returncode != 0:
                 self.status_message = f"Git blame failed: {result.stderr.strip()}"
                 return
@@ -313,47 +262,101 @@ class GitOperationsMixin:
                 self.status_message = f"No blame info for {rel_str}."
                 return
 
-            # Write to temp file and open in pager
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.blame', delete=False) as f:
-                f.write(result.stdout)
-                temp_path = f.name
+            self._show_in_pager(result.stdout, ".blame", "Git blame")
+
+        self._capture_git_output(command, "Git blame", show_blame)
+
+    def _capture_git_output(
+        self,
+        command: List[str],
+        description: str,
+        handle_result: Callable[[subprocess.CompletedProcess], None],
+    ) -> None:
+        """Run ``git`` with the ``command`` arguments without blocking the UI.
+
+        The command runs on a helper thread; once it exits the main loop
+        passes its ``CompletedProcess`` to ``handle_result``.  ``stdout`` is
+        left as bytes so it reaches the pager without a decode/encode round
+        trip; ``stderr`` is decoded for status messages.
+        """
+        if self.background_task is not None:
+            self.status_message = f"{self.background_task.description} is still running."
+            return
 
+        def run() -> subprocess.CompletedProcess:
+            result = run_git(command, capture_output=True)
+            result.stderr = result.stderr.decode(errors="replace")
+            return result
+
+        task = _BackgroundTask(description=description, on_done=handle_result)
+        task.start(run)
+        self.background_task = task
+        self.status_message = f"{description} running..."
+
+    def _show_in_pager(self, data: bytes, suffix: str, description: str) -> None:
+        """Open ``data`` in the pager.
+
+        On Linux with ``/proc`` mounted the data lives in an anonymous
+        in-memory file that the pager opens through ``/proc``, so nothing is
+        written to or removed from disk.  Elsewhere, or if that file cannot be
+        created or reopened through ``/proc``, a temporary file is used instead.
+        """
+        if _memfd_pager_available():
             try:
-                # Add -R flag for less to handle ANSI color codes
-                if "less" in pager.lower():
-                    pager_command = [pager, "-R", temp_path]
+                fd = os.memfd_create(f"nedok{suffix}", os.MFD_CLOEXEC)
+            except OSError:
+                fd = -1
+            if fd >= 0:
+                path = f"/proc/{os.getpid()}/fd/{fd}"
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    # The pager reopens the data by path, so check that works
+                    # before handing the terminal over.
+                    os.close(os.open(path, os.O_RDONLY))
+                except OSError:
+                    pass
                 else:
-                    pager_command = [pager, temp_path]
-                self._run_external(pager_command)
-            finally:
-                Path(temp_path).unlink(missing_ok=True)
+                    self._run_external(self._pager_command(path))
+                    return
+                finally:
+                    os.close(fd)
 
+        try:
+            # Write to temp file and open in pager
+            with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as f:
+                f.write(data)
+                temp_path = f.name
         except OSError as err:
-            self.status_message = f"Git blame failed: {err}"
+            self.status_message = f"{description} failed: {err}"
+            return
+
+        try:
+            self._run_external(self._pager_command(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+    def _pager_command(self, path: str) -> List[str]:
+        """Return the pager invocation for ``path``."""
+        return [self._pager, *self._pager_args, path]
 
     def _git_context(self, entry: "_PaneEntry") -> Tuple[Path, Path] | None:
         """Return ``(repository_root, relative_path)`` for ``entry``."""
         try:
-            resolved = entry.path.resolve()
+            resolved = entry.resolved_path
         except OSError as err:
             self.status_message = f"Cannot resolve path: {err}"
             return None
         search_dir = resolved if entry.is_dir else resolved.parent
         try:
-            result = subprocess.run(
-                ["git", "-C", str(search_dir), "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            repo_root = find_repo_root(search_dir)
         except OSError as err:
             self.status_message = f"Git not available: {err}"
             return None
-        root_text = result.stdout.strip()
-        if result.returncode != 0 or not root_text:
+        if repo_root is None:
             self.status_message = "Not inside a git repository."
             return None
-        repo_root = Path(root_text)
         try:
             relative = resolved.relative_to(repo_root)
         except ValueError:
@@ -364,17 +367,14 @@ class GitOperationsMixin:
     def _run_git_command(self, repo_root: Path, arguments: List[str]) -> bool:
         """Execute ``git`` with ``arguments`` and capture errors for the UI."""
         try:
-            result = subprocess.run(
-                ["git", "-C", str(repo_root), *arguments],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            result = run_git(["-C", str(repo_root), *arguments], capture_output=True)
         except OSError as err:
             self.status_message = f"Git command failed: {err}"
             return False
         if result.returncode != 0:
-            stderr = result.stderr.strip() or result.stdout.strip() or "unknown error"
+            # Output is only decoded when there is an error to show.
+            stderr = (result.stderr.strip() or result.stdout.strip()).decode(errors="replace")
+            stderr = stderr or "unknown error"
             self.status_message = f"Git command failed: {stderr}"
             return False
         return True
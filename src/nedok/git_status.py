@@ -2,73 +2,243 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Repository root cache
+# ---------------------
+# Every Git action and every Git-mode refresh needs the repository root, and
+# asking ``git rev-parse`` costs a process launch each time.  Answers (including
+# "not a repository") are remembered per directory together with the mtimes of
+# that directory and its parents up to the root: creating or removing a
+# ``.git`` anywhere along that chain changes one of them.
+REPO_ROOT_CACHE_MAX_ENTRIES = 256
+# As with directory listings, very recent mtimes are too coarse to trust.
+REPO_ROOT_CACHE_MIN_AGE_NS = 1_000_000_000
+
+_repo_root_cache: Dict[Path, Tuple[Optional[Path], Tuple[int, ...]]] = {}
+_repo_root_lock = threading.Lock()
+
+# Status maps shared inside a git_status_batch() block, keyed by repository
+# root.  ``None`` outside a batch.
+_status_batch: Optional[Dict[Path, "Future[Dict[Path, str]]"]] = None
+_status_batch_lock = threading.Lock()
+
+
+_git_executable: Optional[str] = None
+_git_environment: Optional[Dict[str, str]] = None
+
+
+def _git_options(arguments: Sequence[str], kwargs: Dict[str, Any]) -> List[str]:
+    """Return the argv for ``arguments`` and fill in the shared process options.
+
+    The executable is resolved to an absolute path once and descriptors are
+    left to ``O_CLOEXEC`` (``close_fds=False``), which lets CPython start the
+    process with ``posix_spawn`` instead of ``fork`` + ``exec``.
+
+    The environment is built once on first use.  It sets
+    ``GIT_OPTIONAL_LOCKS=0`` so the browser's frequent ``git status`` runs do
+    not take the index lock and collide with git commands the user runs at
+    the same time.
+    """
+    global _git_executable, _git_environment
+    if _git_executable is None:
+        _git_executable = shutil.which("git") or "git"
+    if _git_environment is None:
+        _git_environment = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+    kwargs.setdefault("env", _git_environment)
+    kwargs.setdefault("close_fds", False)
+    return [_git_executable, *arguments]
+
+
+def run_git(arguments: Sequence[str], **kwargs: Any) -> "subprocess.CompletedProcess":
+    """Run ``git`` with ``arguments`` and wait for it to finish.
+
+    Keyword arguments are passed to :func:`subprocess.run`; see
+    :func:`_git_options` for the defaults added to them.
+    """
+    argv = _git_options(arguments, kwargs)
+    return subprocess.run(argv, check=False, **kwargs)
+
+
+def _directory_chain_mtimes(directory: Path, stop: Optional[Path]) -> Optional[Tuple[int, ...]]:
+    """Return mtimes of ``directory`` and its parents up to ``stop`` (or ``/``)."""
+    mtimes = []
+    current = directory
+    while True:
+        try:
+            mtimes.append(os.stat(current).st_mtime_ns)
+        except OSError:
+            return None
+        parent = current.parent
+        if current == stop or parent == current:
+            return tuple(mtimes)
+        current = parent
+
+
+def find_repo_root(directory: Path) -> Optional[Path]:
+    """Return the top level of the repository containing ``directory``.
+
+    Returns ``None`` outside a repository.  Raises :class:`OSError` when the
+    ``git`` executable cannot be started.
+    """
+    directory = Path(directory)
+    with _repo_root_lock:
+        cached = _repo_root_cache.get(directory)
+    if cached is not None:
+        repo_root, mtimes = cached
+        if _directory_chain_mtimes(directory, repo_root) == mtimes:
+            return repo_root
+
+    result = run_git(
+        ["-C", str(directory), "rev-parse", "--show-toplevel"],
+        capture_output=True,
+    )
+    # Decode like the file system does, so non-UTF-8 names round-trip.
+    root_text = os.fsdecode(result.stdout.rstrip(b"\n"))
+    repo_root = Path(root_text) if result.returncode == 0 and root_text else None
+
+    mtimes = _directory_chain_mtimes(directory, repo_root)
+    with _repo_root_lock:
+        if mtimes and time.time_ns() - max(mtimes) >= REPO_ROOT_CACHE_MIN_AGE_NS:
+            if len(_repo_root_cache) >= REPO_ROOT_CACHE_MAX_ENTRIES:
+                _repo_root_cache.clear()
+            _repo_root_cache[directory] = (repo_root, mtimes)
+            if repo_root is not None and repo_root in directory.parents:
+                # Directories between here and the top level belong to the
+                # same repository; their chains are suffixes of this one.
+                for depth, ancestor in enumerate(directory.parents, start=1):
+                    _repo_root_cache[ancestor] = (repo_root, mtimes[depth:])
+                    if ancestor == repo_root:
+                        break
+        else:
+            _repo_root_cache.pop(directory, None)
+    return repo_root
+
+
+@contextmanager
+def git_status_batch() -> Iterator[None]:
+    """Share ``git status`` results between calls made inside the block.
+
+    When both panes show directories of the same checkout, refreshing them
+    would run ``git status`` on that repository twice.  Inside a batch the
+    second request reuses the first result, waiting for it if the first is
+    still running on another thread.  Nested batches join the outer one.
+    """
+    global _status_batch
+    with _status_batch_lock:
+        owner = _status_batch is None
+        if owner:
+            _status_batch = {}
+    try:
+        yield
+    finally:
+        if owner:
+            with _status_batch_lock:
+                _status_batch = None
 
 
 def collect_git_status(directory: Path) -> Tuple[Path | None, Dict[Path, str]]:
     """Return ``(repository_root, status_map)`` for the given directory.
 
     ``status_map`` is a dictionary where each key is an absolute path inside the
-    repository and each value is the two-character porcelain status code (e.g.
+    repository, below its canonical (symlink-free) top level, and each value is the two-character porcelain status code (e.g.
     ``"??"`` for untracked files).  When ``directory`` is not part of a Git
-    repository we return ``(None, {})``.
+    repository we return ``(None, {})``.  Inside :func:`git_status_batch` the
+    map may be shared with other callers and must not be modified.
     """
     try:
-        root_result = subprocess.run(
-            ["git", "-C", str(directory), "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        repo_root = find_repo_root(directory)
     except OSError:
         return None, {}
-    if root_result.returncode != 0:
+    if repo_root is None:
         return None, {}
-    repo_root = Path(root_result.stdout.strip())
+
+    with _status_batch_lock:
+        batch = _status_batch
+        if batch is None:
+            future = None
+            owner = True
+        else:
+            future = batch.get(repo_root)
+            owner = future is None
+            if owner:
+                future = batch[repo_root] = Future()
+    if not owner:
+        return repo_root, future.result()
+
+    try:
+        status_map = _repository_status(repo_root)
+    except BaseException as err:
+        if future is not None:
+            future.set_exception(err)
+        raise
+    if future is not None:
+        future.set_result(status_map)
+    return repo_root, status_map
+
+
+# Bytes read from ``git status`` per call while streaming its output.
+STATUS_READ_CHUNK = 64 * 1024
+
+
+def _iter_records(stream: IO[bytes]) -> Iterator[bytes]:
+    """Yield the NUL-terminated records of ``stream`` as they arrive."""
+    pending = b""
+    for chunk in iter(lambda: stream.read(STATUS_READ_CHUNK), b""):
+        records = (pending + chunk).split(b"\0")
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+def _repository_status(repo_root: Path) -> Dict[Path, str]:
+    """Run ``git status`` for ``repo_root`` and parse it into a status map.
+
+    Records are parsed while git is still producing them, so large outputs
+    are never held in memory as a whole.
+    """
+    kwargs: Dict[str, Any] = {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL}
+    argv = _git_options(["-C", str(repo_root), "status", "--porcelain=1", "-z"], kwargs)
     try:
-        status_result = subprocess.run(
-            ["git", "-C", str(repo_root), "status", "--porcelain=1", "-z"],
-            capture_output=True,
-            text=False,
-            check=False,
-        )
+        process = subprocess.Popen(argv, **kwargs)
     except OSError:
-        return repo_root, {}
-    if status_result.returncode != 0:
-        return repo_root, {}
+        return {}
 
     status_map: Dict[Path, str] = {}
-    entries = status_result.stdout.split(b"\0")
-    index = 0
-    total = len(entries)
-
-    while index < total:
-        raw_entry = entries[index]
-        index += 1
-        if not raw_entry:
-            continue
-        if len(raw_entry) < 4:
-            continue
-
-        status_bytes = raw_entry[:2]
-        status_code = status_bytes.decode("ascii", errors="replace")
-
-        path_bytes = raw_entry[3:]
-        path_text = path_bytes.decode("utf-8", errors="surrogateescape")
-
-        # Renames/copies include an additional path entry; prefer the new name
-        if status_code and status_code[0] in ("R", "C") and index < total:
-            new_path_bytes = entries[index]
-            index += 1
-            if new_path_bytes:
-                path_text = new_path_bytes.decode("utf-8", errors="surrogateescape")
-
-        absolute = (repo_root / Path(path_text)).resolve(strict=False)
-        status_map[absolute] = status_code
+    with process:
+        records = _iter_records(process.stdout)
+        for raw_entry in records:
+            if len(raw_entry) < 4:
+                continue
 
-    return repo_root, status_map
+            status_bytes = raw_entry[:2]
+            status_code = status_bytes.decode("ascii", errors="replace")
+
+            path_bytes = raw_entry[3:]
+            path_text = path_bytes.decode("utf-8", errors="surrogateescape")
+
+            # Renames/copies include an additional path entry; prefer the new name
+            if status_code[0] in ("R", "C"):
+                new_path_bytes = next(records, b"")
+                if new_path_bytes:
+                    path_text = new_path_bytes.decode("utf-8", errors="surrogateescape")
+
+            # Git reports the top level as a canonical path and never follows
+            # symlinks inside the work tree, so joining needs no resolve().
+            status_map[repo_root / path_text] = status_code
+
+    if process.returncode != 0:
+        return {}
+    return status_map
 
 
-__all__ = ["collect_git_status"]
+__all__ = ["collect_git_status", "find_repo_root", "git_status_batch", "run_git"]
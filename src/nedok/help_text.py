@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, Tuple
 
 from nedok.modes import BrowserMode
 
 
-def build_help_lines(mode: BrowserMode) -> List[str]:
-    """Return formatted help lines for all modes (all commands available)."""
-    lines = [
+def _format_help_lines(mode: BrowserMode) -> Tuple[str, ...]:
+    """Format the help lines for ``mode``."""
+    return (
         f"{mode.label}: ↑↓/jk move | Tab pane | Enter open | Bksp up | s refresh | S ssh | x disconnect | m mode | h help | q quit",
         "File: n rename | d del* | c copy | t move | v view | e edit | f file | F dir | : cmd",
         "Git: a stage | u unstage | r restore* | g diff | l log | b blame | o commit | *confirm needed",
         "Tree: m→t enables left pane tree | + expand dir | - collapse parent | shows recursive hierarchy",
-    ]
-    return lines
+    )
+
+
+# The hints are drawn on every frame but only depend on the mode.
+_HELP_LINES: Dict[BrowserMode, Tuple[str, ...]] = {
+    mode: _format_help_lines(mode) for mode in BrowserMode
+}
+
+
+def build_help_lines(mode: BrowserMode) -> Tuple[str, ...]:
+    """Return formatted help lines for all modes (all commands available)."""
+    return _HELP_LINES[mode]
 
 
 __all__ = ["build_help_lines"]
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import curses
 import os
+import shlex
 import subprocess
-from dataclasses import dataclass
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
 
 from nedok.modes import ALL_MODES, BrowserMode
+from nedok.state import invalidate_listing_cache
 
 if TYPE_CHECKING:
     pass
@@ -17,6 +22,39 @@ if TYPE_CHECKING:
 # Constants
 PAGE_SCROLL_LINES = 5
 
+# Characters that only /bin/sh understands.  Commands without any of them
+# are executed directly, which saves starting a shell for a plain ``ls -l``.
+_SHELL_METACHARACTERS = frozenset(";|&<>$`*?~{}()[]#\\\n")
+# Shell builtins (and keywords) that must reach /bin/sh even when the
+# command line is otherwise simple: some have no program equivalent (cd,
+# export), others have one that behaves differently (echo, pwd).
+_SHELL_BUILTINS = frozenset((
+    ".", ":", "[", "alias", "bg", "break", "cd", "command", "continue",
+    "echo", "eval", "exec", "exit", "export", "false", "fc", "fg", "getopts",
+    "hash", "jobs", "kill", "local", "printf", "pwd", "read", "readonly",
+    "return", "set", "shift", "source", "test", "times", "trap", "true",
+    "type", "ulimit", "umask", "unalias", "unset", "wait",
+    "if", "then", "else", "elif", "fi", "for", "while", "until", "do",
+    "done", "case", "esac", "!",
+))
+
+# Key groups shared by the handlers, built once instead of per key press.
+_ESCAPE_KEY = 27
+_TAB_KEY = ord("\t")
+_ENTER_KEYS = frozenset({curses.KEY_ENTER, ord("\n"), ord("\r")})
+_BACKSPACE_KEYS = frozenset({curses.KEY_BACKSPACE, 127, 8})
+_QUIT_KEYS = frozenset({ord("q"), ord("Q")})
+_CONFIRM_KEYS = frozenset({ord("y"), ord("Y")})
+_DECLINE_KEYS = frozenset({ord("n"), ord("N"), _ESCAPE_KEY})
+
+# Key codes that text fields accept, mapped to the character they insert.
+_PRINTABLE_CHARS: Dict[int, str] = {
+    code: chr(code) for code in range(256) if chr(code).isprintable()
+}
+
+# Bytes requested per read when collecting remote command output.
+REMOTE_READ_CHUNK = 64 * 1024
+
 
 @dataclass(frozen=True)
 class _TextInputModeConfig:
@@ -25,7 +63,91 @@ class _TextInputModeConfig:
     active_flag: str
     buffer_attr: str
     cancel_message: str
-    submit_action: Callable[[], None]
+    submit_method: str
+
+
+_COMMAND_INPUT = _TextInputModeConfig(
+    active_flag="in_command_mode",
+    buffer_attr="command_buffer",
+    cancel_message="Command cancelled.",
+    submit_method="_execute_command",
+)
+_RENAME_INPUT = _TextInputModeConfig(
+    active_flag="in_rename_mode",
+    buffer_attr="rename_buffer",
+    cancel_message="Rename cancelled.",
+    submit_method="_execute_rename",
+)
+_CREATE_INPUT = _TextInputModeConfig(
+    active_flag="in_create_mode",
+    buffer_attr="create_buffer",
+    cancel_message="Create cancelled.",
+    submit_method="_execute_create",
+)
+
+# Key code -> name of the InputHandlersMixin method handling it.  Methods
+# return False to let the key fall through to the mode commands below.
+_NAVIGATION_ACTIONS: Dict[int, str] = {
+    curses.KEY_UP: "_key_cursor_up",
+    ord("k"): "_key_cursor_up",
+    curses.KEY_DOWN: "_key_cursor_down",
+    ord("j"): "_key_cursor_down",
+    curses.KEY_PPAGE: "_key_page_up",
+    curses.KEY_NPAGE: "_key_page_down",
+    ord("\t"): "_key_switch_pane",
+    curses.KEY_RIGHT: "_key_focus_right",
+    curses.KEY_LEFT: "_key_focus_left",
+    curses.KEY_BTAB: "_key_focus_left",
+    ord("h"): "_key_toggle_help",
+    ord("H"): "_key_toggle_help",
+    ord("n"): "_key_rename",
+    ord("f"): "_key_create_file",
+    ord("F"): "_key_create_directory",
+    ord("m"): "_key_mode_prompt",
+    ord("M"): "_key_mode_prompt",
+    ord(":"): "_key_command_mode",
+    curses.KEY_ENTER: "_key_enter",
+    ord("\n"): "_key_enter",
+    ord("\r"): "_key_enter",
+    ord("+"): "_expand_tree_cursor",
+    ord("-"): "_collapse_tree_cursor",
+    curses.KEY_BACKSPACE: "_key_parent",
+    127: "_key_parent",
+    8: "_key_parent",
+    ord("s"): "_key_refresh",
+    ord("S"): "_key_ssh_connect",
+    ord("x"): "_key_disconnect",
+    ord("X"): "_key_disconnect",
+    curses.KEY_RESIZE: "_key_resize",
+}
+
+# The mode prompt selects a mode by the initial of its label, in either case.
+# Iterating in reverse lets the first mode win if two labels share an initial.
+_MODE_BY_KEY: Dict[int, BrowserMode] = {
+    ord(initial): mode
+    for mode in reversed(ALL_MODES)
+    for initial in (mode.label[0].lower(), mode.label[0].upper())
+}
+
+# Mode commands respond to both cases of their letter.
+_MODE_COMMAND_ACTIONS: Dict[int, str] = {
+    ord(key): action
+    for letter, action in (
+        ("d", "_delete_entry"),
+        ("c", "_copy_entry"),
+        ("t", "_move_entry"),
+        ("v", "_view_file"),
+        ("e", "_open_in_editor"),
+        ("a", "_git_stage_entry"),
+        ("u", "_git_unstage_entry"),
+        ("r", "_git_restore_entry"),
+        ("g", "_git_diff_entry"),
+        ("o", "_git_commit"),
+        ("l", "_git_log_entry"),
+        ("b", "_git_blame_entry"),
+    )
+    for key in (letter, letter.upper())
+}
 
 
 @dataclass
@@ -47,6 +169,148 @@ class _PendingAction:
         return (self.message, self.confirm_action)[index]
 
 
+@dataclass
+class _RunningCommand:
+    """A local console command whose output is read on a background thread.
+
+    Only the newest ``max_lines`` lines are kept, so a command that prints a
+    lot (``find /``) never holds more than one screenful of history.
+    """
+
+    process: subprocess.Popen
+    directory: Union[Path, str]
+    max_lines: int
+    lines: Deque[str] = field(init=False)
+    dropped_lines: int = 0
+    received_lines: int = 0
+    reader: Optional[threading.Thread] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _shown_lines: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self.lines = deque(maxlen=self.max_lines)
+
+    def start(self) -> None:
+        """Begin draining the process output without blocking the UI."""
+        self.reader = threading.Thread(target=self._drain, daemon=True)
+        self.reader.start()
+
+    def _drain(self) -> None:
+        assert self.process.stdout is not None
+        with self.process.stdout:
+            for line in self.process.stdout:
+                with self._lock:
+                    if len(self.lines) == self.max_lines:
+                        self.dropped_lines += 1
+                    self.lines.append(line.rstrip("\n"))
+                    self.received_lines += 1
+
+    def snapshot(self) -> List[str]:
+        """Return a copy of the buffered output lines."""
+        with self._lock:
+            return list(self.lines)
+
+    def take_new_output(self) -> bool:
+        """Return True if lines arrived since the previous call."""
+        received = self.received_lines
+        if received == self._shown_lines:
+            return False
+        self._shown_lines = received
+        return True
+
+    @property
+    def finished(self) -> bool:
+        """True once all output has been read (the pipe reached EOF)."""
+        return self.reader is not None and not self.reader.is_alive()
+
+
+def _direct_argv(command: str) -> Optional[List[str]]:
+    """Return the argument vector for ``command`` if it needs no shell."""
+    if any(char in _SHELL_METACHARACTERS for char in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    # ``FOO=bar cmd`` is a shell assignment, not a program name.
+    if not argv or "=" in argv[0] or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
+
+def _spawn_command(command: str, cwd: Union[Path, str]) -> subprocess.Popen:
+    """Start ``command`` in ``cwd`` with stdout and stderr on one pipe.
+
+    Simple commands are executed directly; anything else – shell builtins,
+    and names that turn out not to be programs on ``PATH``, such as shell
+    functions – goes through ``/bin/sh`` so it behaves exactly as typed.
+    """
+    options = dict(
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    argv = _direct_argv(command)
+    if argv is not None:
+        try:
+            return subprocess.Popen(argv, **options)
+        except (FileNotFoundError, PermissionError):
+            pass
+    return subprocess.Popen(command, shell=True, **options)
+
+
+def _read_tail(stream: BinaryIO, max_lines: int) -> Tuple[List[str], int]:
+    """Read ``stream`` to EOF, keeping only its last ``max_lines`` lines.
+
+    Returns the kept lines and how many earlier lines were discarded, so a
+    command that prints gigabytes never holds more than the tail in memory.
+    """
+    lines: Deque[str] = deque(maxlen=max_lines)
+    dropped = 0
+    pending = b""
+    while True:
+        chunk = stream.read(REMOTE_READ_CHUNK)
+        if not chunk:
+            break
+        *complete, pending = (pending + chunk).split(b"\n")
+        for raw in complete:
+            if len(lines) == max_lines:
+                dropped += 1
+            lines.append(raw.rstrip(b"\r").decode("utf-8", errors="replace"))
+    if pending:
+        if len(lines) == max_lines:
+            dropped += 1
+        lines.append(pending.decode("utf-8", errors="replace"))
+    return list(lines), dropped
+
+
+@dataclass
+class _BackgroundTask:
+    """Work running on a helper thread whose result the main loop applies.
+
+    ``on_done`` runs on the UI thread (from :meth:`_poll_background_task`),
+    so it may update browser state and take over the terminal.
+    """
+
+    description: str
+    on_done: Callable[[Any], None]
+    future: "Future[Any]" = field(default_factory=Future, repr=False)
+
+    def start(self, work: Callable[[], Any]) -> None:
+        """Run ``work`` on a daemon thread and record its outcome."""
+
+        def run() -> None:
+            try:
+                self.future.set_result(work())
+            except BaseException as err:
+                self.future.set_exception(err)
+
+        threading.Thread(target=run, daemon=True).start()
+
+
 @dataclass
 class _AvailableSSHCredentials:
     """Describe credentials discovered for a host."""
@@ -68,183 +332,171 @@ class InputHandlersMixin:
 
     def _handle_navigation_key(self, key_code: int) -> bool:
         """Handle navigation keys while not in command mode."""
-        pane = self._active_pane
-        if key_code in (curses.KEY_UP, ord("k")):
-            pane.move_cursor(-1)
-            return True
-        if key_code in (curses.KEY_DOWN, ord("j")):
-            pane.move_cursor(1)
-            return True
-        if key_code in (curses.KEY_PPAGE,):
-            pane.move_cursor(-PAGE_SCROLL_LINES)
-            return True
-        if key_code in (curses.KEY_NPAGE,):
-            pane.move_cursor(PAGE_SCROLL_LINES)
-            return True
-        if key_code in (ord("\t"),):
-            # Tab toggles between panes
-            self.active_index = 1 - self.active_index
-            return True
-        if key_code in (curses.KEY_RIGHT,):
-            self.active_index = 1
-            return True
-        if key_code in (curses.KEY_LEFT, curses.KEY_BTAB):
-            self.active_index = 0
+        action = _NAVIGATION_ACTIONS.get(key_code)
+        if action is not None and getattr(self, action)():
             return True
-        if key_code in (ord("h"), ord("H")):
-            self.show_help = not self.show_help
-            self.in_mode_prompt = False
-            self.in_command_mode = False
-            self.in_rename_mode = False
-            self.in_create_mode = False
-            self.status_message = "Help displayed." if self.show_help else None
-            return True
-        if key_code in (ord("n"),) and not self.show_help:
-            self._dismiss_overlays()
-            self._start_rename()
-            return True
-        if key_code in (ord("f"),) and not self.show_help:
-            self._dismiss_overlays()
-            self._create_file()
-            return True
-        if key_code in (ord("F"),) and not self.show_help:
-            self._dismiss_overlays()
-            self._create_directory()
-            return True
-        if key_code in (ord("m"), ord("M")):
-            self.in_mode_prompt = True
-            self.show_help = False
-            self.in_command_mode = False
-            self.status_message = "Select a mode."
-            return True
-        if key_code == ord(":") and not self.show_help and not self.in_mode_prompt:
-            self._start_command_mode()
-            return True
-        if key_code in (curses.KEY_ENTER, ord("\n"), ord("\r")):
-            before_dir = pane.current_dir
-            try:
-                pane.enter_selected(self.mode)
-                self.status_message = None
-            except PermissionError as err:
-                self.status_message = str(err)
-            except FileNotFoundError as err:
-                self.status_message = str(err)
-            if before_dir != pane.current_dir:
-                self.status_message = None
-            return True
-        if key_code == ord("+") and self._expand_tree_cursor():
-            return True
-        if key_code == ord("-") and self._collapse_tree_cursor():
-            return True
-        if key_code in (curses.KEY_BACKSPACE, 127, 8):
-            try:
-                pane.go_to_parent()
-                self._refresh_pane(pane)
-                self.status_message = None
-            except PermissionError as err:
-                self.status_message = str(err)
-            return True
-        if key_code == ord("s"):
-            self._dismiss_overlays()
-            self._refresh_active_pane()
-            return True
-        if key_code == ord("S"):
-            self._dismiss_overlays()
-            self._start_ssh_connect()
-            return True
-        if key_code in (ord("x"), ord("X")):
-            self._dismiss_overlays()
-            self._disconnect_ssh()
-            return True
-        if self._handle_mode_command(key_code):
-            return True
-        if key_code == curses.KEY_RESIZE:
-            return True
-        return False
+        return self._handle_mode_command(key_code)
+
+    def _key_cursor_up(self) -> bool:
+        """Move the cursor up one entry."""
+        return self._active_pane.move_cursor(-1)
+
+    def _key_cursor_down(self) -> bool:
+        """Move the cursor down one entry."""
+        return self._active_pane.move_cursor(1)
+
+    def _key_page_up(self) -> bool:
+        """Scroll the cursor up by a page step."""
+        return self._active_pane.move_cursor(-PAGE_SCROLL_LINES)
+
+    def _key_page_down(self) -> bool:
+        """Scroll the cursor down by a page step."""
+        return self._active_pane.move_cursor(PAGE_SCROLL_LINES)
+
+    def _key_switch_pane(self) -> bool:
+        """Toggle focus between the panes."""
+        self.active_index = 1 - self.active_index
+        return True
+
+    def _key_focus_right(self) -> bool:
+        """Focus the right pane."""
+        changed = self.active_index != 1
+        self.active_index = 1
+        return changed
+
+    def _key_focus_left(self) -> bool:
+        """Focus the left pane."""
+        changed = self.active_index != 0
+        self.active_index = 0
+        return changed
+
+    def _key_toggle_help(self) -> bool:
+        """Show or hide the help overlay."""
+        self.show_help = not self.show_help
+        self.in_mode_prompt = False
+        self.in_command_mode = False
+        self.in_rename_mode = False
+        self.in_create_mode = False
+        self.status_message = "Help displayed." if self.show_help else None
+        return True
+
+    def _key_rename(self) -> bool:
+        """Start renaming the selected entry."""
+        if self.show_help:
+            return False
+        self._dismiss_overlays()
+        self._start_rename()
+        return True
+
+    def _key_create_file(self) -> bool:
+        """Start creating a file."""
+        if self.show_help:
+            return False
+        self._dismiss_overlays()
+        self._create_file()
+        return True
+
+    def _key_create_directory(self) -> bool:
+        """Start creating a directory."""
+        if self.show_help:
+            return False
+        self._dismiss_overlays()
+        self._create_directory()
+        return True
+
+    def _key_mode_prompt(self) -> bool:
+        """Open the mode selection prompt."""
+        self.in_mode_prompt = True
+        self.show_help = False
+        self.in_command_mode = False
+        self.status_message = "Select a mode."
+        return True
+
+    def _key_command_mode(self) -> bool:
+        """Start capturing a shell command."""
+        if self.show_help or self.in_mode_prompt:
+            return False
+        self._start_command_mode()
+        return True
+
+    def _key_enter(self) -> bool:
+        """Open the selected entry."""
+        pane = self._active_pane
+        before_dir = pane.current_dir
+        try:
+            pane.enter_selected(self.mode)
+            self.status_message = None
+        except PermissionError as err:
+            self.status_message = str(err)
+        except FileNotFoundError as err:
+            self.status_message = str(err)
+        if before_dir != pane.current_dir:
+            self.status_message = None
+        return True
+
+    def _key_parent(self) -> bool:
+        """Navigate to the parent directory."""
+        pane = self._active_pane
+        try:
+            pane.go_to_parent()
+            self._refresh_pane(pane)
+            self.status_message = None
+        except PermissionError as err:
+            self.status_message = str(err)
+        return True
+
+    def _key_refresh(self) -> bool:
+        """Reload the active pane."""
+        self._dismiss_overlays()
+        self._refresh_active_pane()
+        return True
+
+    def _key_ssh_connect(self) -> bool:
+        """Open the SSH connection dialog."""
+        self._dismiss_overlays()
+        self._start_ssh_connect()
+        return True
+
+    def _key_disconnect(self) -> bool:
+        """Disconnect the active pane from SSH."""
+        self._dismiss_overlays()
+        self._disconnect_ssh()
+        return True
+
+    def _key_resize(self) -> bool:
+        """Accept terminal resizes; the next frame picks up the new size."""
+        return True
 
     def _handle_mode_selection_key(self, key_code: int) -> bool:
         """Handle mode selection popup keys."""
-        if key_code == 27:  # ESC
+        if key_code == _ESCAPE_KEY:
             self.in_mode_prompt = False
             self.status_message = "Mode selection cancelled."
             return True
-        if 0 <= key_code <= 255:
-            char = chr(key_code).lower()
-            for candidate in ALL_MODES:
-                initial = candidate.label[0].lower()
-                if char == initial:
-                    if candidate is not self.mode:
-                        self.mode = candidate
-                        for pane in (self.left, self.right):
-                            self._refresh_pane(pane)
-                        self.status_message = f"Switched to {self.mode.label} mode."
-                    else:
-                        self.status_message = f"Already in {self.mode.label} mode."
-                    self.in_mode_prompt = False
-                    return True
-        return False
+        candidate = _MODE_BY_KEY.get(key_code)
+        if candidate is None:
+            return False
+        if candidate is not self.mode:
+            self.mode = candidate
+            self._refresh_both_panes()
+            self.status_message = f"Switched to {self.mode.label} mode."
+        else:
+            self.status_message = f"Already in {self.mode.label} mode."
+        self.in_mode_prompt = False
+        return True
 
     def _handle_mode_command(self, key_code: int) -> bool:
         """Execute commands tied to the active mode."""
-        if key_code in (ord("d"), ord("D")):
-            self._dismiss_overlays()
-            self._delete_entry()
-            return True
-        if key_code in (ord("c"), ord("C")):
-            self._dismiss_overlays()
-            self._copy_entry()
-            return True
-        if key_code in (ord("t"), ord("T")):
-            self._dismiss_overlays()
-            self._move_entry()
-            return True
-        if key_code in (ord("v"), ord("V")):
-            self._dismiss_overlays()
-            self._view_file()
-            return True
-        if key_code in (ord("e"), ord("E")):
-            self._dismiss_overlays()
-            self._open_in_editor()
-            return True
-        if key_code in (ord("a"), ord("A")):
-            self._dismiss_overlays()
-            self._git_stage_entry()
-            return True
-        if key_code in (ord("u"), ord("U")):
-            self._dismiss_overlays()
-            self._git_unstage_entry()
-            return True
-        if key_code in (ord("r"), ord("R")):
-            self._dismiss_overlays()
-            self._git_restore_entry()
-            return True
-        if key_code in (ord("g"), ord("G")):
-            self._dismiss_overlays()
-            self._git_diff_entry()
-            return True
-        if key_code in (ord("o"), ord("O")):
-            self._dismiss_overlays()
-            self._git_commit()
-            return True
-        if key_code in (ord("l"), ord("L")):
-            self._dismiss_overlays()
-            self._git_log_entry()
-            return True
-        if key_code in (ord("b"), ord("B")):
-            self._dismiss_overlays()
-            self._git_blame_entry()
-            return True
-        return False
+        action = _MODE_COMMAND_ACTIONS.get(key_code)
+        if action is None:
+            return False
+        self._dismiss_overlays()
+        getattr(self, action)()
+        return True
 
     def _handle_command_key(self, key_code: int) -> bool:
         """Handle key presses while capturing a shell command."""
-        mode = _TextInputModeConfig(
-            active_flag="in_command_mode",
-            buffer_attr="command_buffer",
-            cancel_message="Command cancelled.",
-            submit_action=self._execute_command,
-        )
-        return self._handle_text_input_mode(key_code, mode)
+        return self._handle_text_input_mode(key_code, _COMMAND_INPUT)
 
     def _handle_confirmation_key(self, key_code: int) -> bool:
         """Handle y/n confirmation."""
@@ -252,38 +504,28 @@ class InputHandlersMixin:
             return False
 
         pending = self.pending_action
-        if key_code in (ord('y'), ord('Y')):
+        if key_code in _CONFIRM_KEYS:
             self.pending_action = None
             pending.confirm_action()
             return True
-        if key_code in (ord('n'), ord('N'), 27):  # n, N, or ESC
+        if key_code in _DECLINE_KEYS:
             self.pending_action = None
             if pending.cancel_action:
                 pending.cancel_action()
             else:
                 self.status_message = pending.cancel_message
             return True
+        # Swallow anything else so the prompt stays as it is instead of being
+        # replaced by an "Unhandled keypress." status; nothing to repaint.
         return False
 
     def _handle_rename_key(self, key_code: int) -> bool:
         """Handle key presses during rename."""
-        mode = _TextInputModeConfig(
-            active_flag="in_rename_mode",
-            buffer_attr="rename_buffer",
-            cancel_message="Rename cancelled.",
-            submit_action=self._execute_rename,
-        )
-        return self._handle_text_input_mode(key_code, mode)
+        return self._handle_text_input_mode(key_code, _RENAME_INPUT)
 
     def _handle_create_key(self, key_code: int) -> bool:
         """Handle key presses during file/dir creation."""
-        mode = _TextInputModeConfig(
-            active_flag="in_create_mode",
-            buffer_attr="create_buffer",
-            cancel_message="Create cancelled.",
-            submit_action=self._execute_create,
-        )
-        return self._handle_text_input_mode(key_code, mode)
+        return self._handle_text_input_mode(key_code, _CREATE_INPUT)
 
     def _request_confirmation(
         self,
@@ -305,6 +547,7 @@ class InputHandlersMixin:
     def _refresh_active_pane(self) -> None:
         """Refresh the active pane to reload directory contents."""
         pane = self._active_pane
+        invalidate_listing_cache(pane.current_dir)
         try:
             self._refresh_pane(pane)
             self.status_message = f"Refreshed {pane.current_dir}"
@@ -360,12 +603,18 @@ class InputHandlersMixin:
                 stdin, stdout, stderr = pane.ssh_connection.client.exec_command(
                     f"cd {pane.current_dir} && {command}"
                 )
-                stdout_text = stdout.read().decode('utf-8', errors='replace')
-                stderr_text = stderr.read().decode('utf-8', errors='replace')
+                from .browser import OUTPUT_BUFFER_MAX_LINES
+
+                stdout_lines, stdout_dropped = _read_tail(stdout, OUTPUT_BUFFER_MAX_LINES)
+                stderr_lines, stderr_dropped = _read_tail(stderr, OUTPUT_BUFFER_MAX_LINES)
                 exit_code = stdout.channel.recv_exit_status()
 
                 # Add output to console
-                output_lines = self._format_command_output(stdout_text, stderr_text)
+                output_lines = self._format_command_output(
+                    stdout_lines,
+                    stderr_lines,
+                    dropped=stdout_dropped + stderr_dropped,
+                )
                 for line in output_lines:
                     self.console_buffer.append(line)
 
@@ -377,30 +626,78 @@ class InputHandlersMixin:
                 self._add_console_message(message)
                 self.status_message = "Remote command execution failed."
         else:
-            # Execute command locally
+            if self.running_command is not None:
+                message = "A command is still running."
+                self._add_console_message(message)
+                self.status_message = message
+                return
+
+            from .browser import OUTPUT_BUFFER_MAX_LINES
+
+            # Execute command locally; output is streamed by a reader thread
+            # and collected by _poll_running_command from the main loop.
             try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=pane.current_dir,
-                    capture_output=True,
-                    text=True,
-                    env=os.environ.copy(),
-                )
+                process = _spawn_command(command, pane.current_dir)
             except OSError as err:
                 message = f"Failed to run command: {err}"
                 self._add_console_message(message)
                 self.status_message = "Command execution failed."
                 return
 
-            # Add output to console
-            output_lines = self._format_command_output(result.stdout, result.stderr)
-            for line in output_lines:
-                self.console_buffer.append(line)
+            running = _RunningCommand(
+                process=process,
+                directory=pane.current_dir,
+                max_lines=OUTPUT_BUFFER_MAX_LINES,
+            )
+            running.start()
+            self.running_command = running
+            self.status_message = "Command running..."
+
+    def _poll_running_command(self) -> bool:
+        """Finish the background command once its output is drained.
+
+        Returns True when the console changed – new output arrived or the
+        command completed – so the caller knows a repaint is needed.
+        """
+        running = self.running_command
+        if running is None:
+            return False
+        if not running.finished:
+            return running.take_new_output()
+        self.running_command = None
+        exit_code = running.process.wait()
+
+        # The command may have changed files; make the next refresh rescan.
+        invalidate_listing_cache(running.directory)
+
+        output_lines = running.snapshot() or ["<no output>"]
+        if running.dropped_lines:
+            output_lines[:0] = [f"... [truncated {running.dropped_lines} lines] ...", ""]
+        self.console_buffer.extend(output_lines)
+
+        message = f"Command exited with code {exit_code}."
+        self._add_console_message(message)
+        self.status_message = message
+        return True
+
+    def _poll_background_task(self) -> bool:
+        """Apply the result of a finished background task.
 
-            message = f"Command exited with code {result.returncode}."
-            self._add_console_message(message)
-            self.status_message = message
+        Returns True when a task completed so the caller repaints.  A
+        finished task stays queued while a prompt or dialog is open, since
+        ``on_done`` may take over the terminal.
+        """
+        task = self.background_task
+        if task is None or not task.future.done() or self._in_modal_input():
+            return False
+        self.background_task = None
+        try:
+            result = task.future.result()
+        except OSError as err:
+            self.status_message = f"{task.description} failed: {err}"
+            return True
+        task.on_done(result)
+        return True
 
     def _start_ssh_connect(self) -> None:
         """Start SSH connection input mode."""
@@ -416,7 +713,7 @@ class InputHandlersMixin:
         """Handle key presses during SSH connection setup."""
         if key_code == curses.KEY_RESIZE:
             return True
-        if key_code == 27:  # ESC
+        if key_code == _ESCAPE_KEY:
             self.in_ssh_connect_mode = False
             self.ssh_host_buffer = ""
             self.ssh_user_buffer = ""
@@ -424,7 +721,7 @@ class InputHandlersMixin:
             self.ssh_input_field = 0
             self.status_message = "SSH connection cancelled."
             return True
-        if key_code in (curses.KEY_ENTER, ord("\n"), ord("\r")):
+        if key_code in _ENTER_KEYS:
             if self.ssh_input_field == 0 and self._handle_host_field_exit():
                 return True
             if self.ssh_input_field < 2:
@@ -433,13 +730,13 @@ class InputHandlersMixin:
             # Final field - execute connection
             self._execute_ssh_connect()
             return True
-        if key_code == ord("\t"):
+        if key_code == _TAB_KEY:
             # Tab to next field
             if self.ssh_input_field == 0 and self._handle_host_field_exit():
                 return True
             self.ssh_input_field = (self.ssh_input_field + 1) % 3
             return True
-        if key_code in (curses.KEY_BACKSPACE, 127, 8):
+        if key_code in _BACKSPACE_KEYS:
             if self.ssh_input_field == 0:
                 self.ssh_host_buffer = self.ssh_host_buffer[:-1]
             elif self.ssh_input_field == 1:
@@ -447,13 +744,14 @@ class InputHandlersMixin:
             elif self.ssh_input_field == 2:
                 self.ssh_password_buffer = self.ssh_password_buffer[:-1]
             return True
-        if 0 <= key_code <= 255 and chr(key_code).isprintable():
+        char = _PRINTABLE_CHARS.get(key_code)
+        if char is not None:
             if self.ssh_input_field == 0:
-                self.ssh_host_buffer += chr(key_code)
+                self.ssh_host_buffer += char
             elif self.ssh_input_field == 1:
-                self.ssh_user_buffer += chr(key_code)
+                self.ssh_user_buffer += char
             elif self.ssh_input_field == 2:
-                self.ssh_password_buffer += chr(key_code)
+                self.ssh_password_buffer += char
             return True
         return False
 
@@ -671,46 +969,54 @@ class InputHandlersMixin:
         """Shared handler for simple buffered text input modes."""
         if key_code == curses.KEY_RESIZE:
             return True
-        if key_code == 27:  # ESC
+        if key_code == _ESCAPE_KEY:
             setattr(self, mode.active_flag, False)
             setattr(self, mode.buffer_attr, "")
             self.status_message = mode.cancel_message
             return True
-        if key_code in (curses.KEY_ENTER, ord("\n"), ord("\r")):
-            mode.submit_action()
+        if key_code in _ENTER_KEYS:
+            getattr(self, mode.submit_method)()
             return True
-        if key_code in (curses.KEY_BACKSPACE, 127, 8):
+        if key_code in _BACKSPACE_KEYS:
             current_value = getattr(self, mode.buffer_attr)
             setattr(self, mode.buffer_attr, current_value[:-1])
             return True
-        if 0 <= key_code <= 255 and chr(key_code).isprintable():
+        char = _PRINTABLE_CHARS.get(key_code)
+        if char is not None:
             current_value = getattr(self, mode.buffer_attr)
-            setattr(self, mode.buffer_attr, current_value + chr(key_code))
+            setattr(self, mode.buffer_attr, current_value + char)
             return True
+        # Ignore other keys (arrows, function keys) while typing.
         return False
 
-    def _format_command_output(self, stdout_text: str, stderr_text: str) -> List[str]:
-        """Combine stdout/stderr text and truncate to fit the UI buffer."""
-        output_lines: List[str] = []
-        if stdout_text:
-            output_lines.extend(stdout_text.rstrip("\n").splitlines())
-        if stderr_text:
+    def _format_command_output(
+        self,
+        stdout_lines: Sequence[str],
+        stderr_lines: Sequence[str],
+        dropped: int = 0,
+    ) -> List[str]:
+        """Combine stdout/stderr lines and truncate to fit the UI buffer.
+
+        ``dropped`` counts lines that were already discarded while reading.
+        """
+        output_lines: List[str] = list(stdout_lines)
+        if stderr_lines:
             if output_lines:
                 output_lines.append("--- stderr ---")
-            output_lines.extend(stderr_text.rstrip("\n").splitlines())
+            output_lines.extend(stderr_lines)
 
         if not output_lines:
             output_lines = ["<no output>"]
-        return self._trim_output_for_display(output_lines)
+        return self._trim_output_for_display(output_lines, dropped)
 
-    def _trim_output_for_display(self, output_lines: List[str]) -> List[str]:
+    def _trim_output_for_display(self, output_lines: List[str], dropped: int = 0) -> List[str]:
         """Ensure command output stays within the UI buffer size."""
         from .browser import OUTPUT_BUFFER_MAX_LINES
 
-        if len(output_lines) <= OUTPUT_BUFFER_MAX_LINES:
+        if len(output_lines) <= OUTPUT_BUFFER_MAX_LINES and not dropped:
             return output_lines
 
-        truncated_count = len(output_lines) - OUTPUT_BUFFER_MAX_LINES
+        truncated_count = max(len(output_lines) - OUTPUT_BUFFER_MAX_LINES, 0) + dropped
         return [
             f"... [truncated {truncated_count} lines] ...",
             "",
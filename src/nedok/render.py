@@ -10,7 +10,8 @@ about file operations or Git behaviour.
 from __future__ import annotations
 
 import curses
-from typing import Optional, Tuple, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Tuple, TYPE_CHECKING, Union
 
 from nedok.colors import get_file_color, get_git_color
 from nedok.help_text import build_help_lines
@@ -25,7 +26,7 @@ from nedok.render_dialogs import (
     render_ssh_connect_input,
 )
 from nedok.render_utils import determine_column_widths, draw_frame, draw_frame_title, truncate, truncate_end
-from nedok.state import _PaneState
+from nedok.state import _PaneEntry, _PaneState
 
 if TYPE_CHECKING:
     from nedok.browser import DualPaneBrowser
@@ -189,7 +190,7 @@ def render_browser_pane(
         return
 
     draw_frame(stdscr, origin_y, origin_x, height, width)
-    draw_frame_title(stdscr, origin_y, origin_x, width, pane.current_dir_display)
+    draw_frame_title(stdscr, origin_y, origin_x, width, pane.frame_title(max(width - 2, 0)))
 
     interior_width = max(width - 2, 0)
     interior_height = max(height - 2, 0)
@@ -202,121 +203,150 @@ def render_browser_pane(
     header_y = origin_y + 1
     name_x = origin_x + 1
     mode_x = name_x + name_width + 1
+    # Mode, size and modified share one attribute per row, so they are
+    # written as a single pre-padded string instead of one call per column.
+    columns_width = max(interior_width - name_width - 1, 0)
     size_x = mode_x + mode_width + 1
-    modified_x = size_x + size_width + 1
-
-    header_attr = curses.A_BOLD
-    stdscr.addnstr(
-        header_y,
-        name_x,
-        truncate("Name", name_width).ljust(name_width),
-        name_width,
-        header_attr,
+    gap_columns = tuple(
+        gap_x
+        for gap_x in (size_x - 1, size_x + size_width)
+        if gap_x < mode_x + columns_width
     )
 
+    column_widths = (name_width, mode_width, size_width, modified_width)
+    header_text = _header_text(mode, column_widths)
+    stdscr.addnstr(header_y, name_x, header_text, interior_width, curses.A_BOLD)
+
+    viewport_height = max(interior_height - 1, 0)
+    entries = pane.entries[pane.scroll_offset : pane.scroll_offset + viewport_height]
+
+    # Padded row text only changes when the entries (refresh) or the layout
+    # change, so reuse it across frames instead of re-truncating every row.
+    show_tree = mode is BrowserMode.TREE and pane.tree_mode_enabled
+    row_cache = pane.row_cache_for((mode, show_tree, column_widths))
+
+    cursor_row = pane.cursor_index - pane.scroll_offset if is_active else -1
+    for index, entry in enumerate(entries):
+        absolute_index = pane.scroll_offset + index
+        row = row_cache.get(absolute_index)
+        if row is None:
+            row = _format_entry_row(entry, mode, show_tree, column_widths)
+            row_cache[absolute_index] = row
+        name_text, columns_text, color_attrs = row
+
+        # Add reverse video for selected item
+        if index == cursor_row:
+            name_attrs = color_attrs | curses.A_REVERSE
+            base_attrs = curses.A_REVERSE
+        else:
+            name_attrs = color_attrs
+            base_attrs = curses.A_NORMAL
+
+        y = header_y + 1 + index
+        stdscr.addnstr(y, name_x, name_text, name_width, name_attrs)
+        if columns_width:
+            stdscr.addnstr(y, mode_x, columns_text, columns_width, base_attrs)
+            if index == cursor_row:
+                # Keep the highlight off the gaps between columns.
+                for gap_x in gap_columns:
+                    stdscr.addnstr(y, gap_x, " ", 1, curses.A_NORMAL)
+
+
+@lru_cache(maxsize=32)
+def _header_text(mode: BrowserMode, column_widths: Tuple[int, int, int, int]) -> str:
+    """Return the padded column header line for a mode and layout."""
+    name_width, mode_width, size_width, modified_width = column_widths
+
     # Mode column header
     if mode is BrowserMode.FILE or mode is BrowserMode.OWNER:
         mode_header = "Mode"
     else:  # Git mode
         mode_header = "Git"
-    stdscr.addnstr(
-        header_y,
-        mode_x,
-        truncate(mode_header, mode_width).ljust(mode_width),
-        mode_width,
-        header_attr,
-    )
-
-    # Third column header (Size or User)
-    if mode is BrowserMode.OWNER:
-        size_header = "User"
-        size_align = str.ljust
-    else:
-        size_header = "Size"
-        size_align = str.rjust
-    stdscr.addnstr(
-        header_y,
-        size_x,
-        truncate(size_header, size_width) if mode is BrowserMode.OWNER else truncate(size_header, size_width).rjust(size_width),
-        size_width,
-        header_attr,
-    )
 
-    # Fourth column header (Modified or Group)
+    # Third and fourth column headers (Size/Modified or User/Group)
     if mode is BrowserMode.OWNER:
+        size_header = truncate("User", size_width).ljust(size_width)
         modified_header = "Group"
     else:
+        size_header = truncate("Size", size_width).rjust(size_width)
         modified_header = "Modified"
-    stdscr.addnstr(
-        header_y,
-        modified_x,
-        truncate(modified_header, modified_width).ljust(modified_width),
-        modified_width,
-        header_attr,
+
+    return " ".join(
+        (
+            truncate("Name", name_width).ljust(name_width),
+            truncate(mode_header, mode_width).ljust(mode_width),
+            size_header,
+            truncate(modified_header, modified_width).ljust(modified_width),
+        )
     )
 
-    viewport_height = max(interior_height - 1, 0)
-    entries = pane.entries[pane.scroll_offset : pane.scroll_offset + viewport_height]
 
-    for index, entry in enumerate(entries):
-        y = header_y + 1 + index
-        absolute_index = pane.scroll_offset + index
-
-        # Get appropriate color based on mode
-        if mode is BrowserMode.GIT:
-            color_attrs = get_git_color(entry)
+def _format_entry_row(
+    entry: _PaneEntry,
+    mode: BrowserMode,
+    show_tree: bool,
+    column_widths: Tuple[int, int, int, int],
+) -> Tuple[Union[str, bytes], Union[str, bytes], int]:
+    """Return the padded name column, the remaining columns and the colour."""
+    name_width, mode_width, size_width, modified_width = column_widths
+
+    if show_tree:
+        indent = "  " * entry.tree_depth
+        if entry.is_dir:
+            indicator = "+" if entry.tree_is_collapsed else "-"
         else:
-            # FILE and OWNER modes use file colors
-            color_attrs = get_file_color(entry)
+            indicator = " "
+        tree_label = f"{indent}{indicator} {entry.display_name}"
+        name_text = truncate(tree_label, name_width)
+    else:
+        name_text = truncate(entry.display_name, name_width)
 
-        # Add reverse video for selected item
-        if is_active and absolute_index == pane.cursor_index:
-            name_attrs = color_attrs | curses.A_REVERSE
-            base_attrs = curses.A_REVERSE
-        else:
-            name_attrs = color_attrs
-            base_attrs = curses.A_NORMAL
+    # Mode column value
+    if mode is BrowserMode.GIT:
+        mode_value = entry.git_status or "-"
+    else:
+        # FILE and OWNER modes show file mode
+        mode_value = entry.display_mode
+    mode_text = truncate(mode_value, mode_width)
 
-        if mode is BrowserMode.TREE and getattr(pane, "tree_mode_enabled", False):
-            indent = "  " * getattr(entry, "tree_depth", 0)
-            if entry.is_dir:
-                indicator = "+" if entry.tree_is_collapsed else "-"
-            else:
-                indicator = " "
-            tree_label = f"{indent}{indicator} {entry.display_name}"
-            name_text = truncate(tree_label, name_width)
-        else:
-            name_text = truncate(entry.display_name, name_width)
+    # Third and fourth columns depend on mode
+    if mode is BrowserMode.OWNER:
+        # OWNER mode: show user and group
+        owner_parts = entry.display_owner.split(":", 1)
+        size_text = truncate(owner_parts[0] if len(owner_parts) > 0 else "-", size_width)
+        modified_text = truncate(owner_parts[1] if len(owner_parts) > 1 else "-", modified_width)
+    else:
+        # FILE and GIT modes: show size and modified
+        size_text = truncate(entry.display_size, size_width)
+        modified_text = truncate(entry.display_modified, modified_width)
 
-        # Mode column value
-        if mode is BrowserMode.GIT:
-            mode_value = entry.git_status or "-"
-        else:
-            # FILE and OWNER modes show file mode
-            mode_value = entry.display_mode
-        mode_text = truncate(mode_value, mode_width)
-
-        # Third and fourth columns depend on mode
-        if mode is BrowserMode.OWNER:
-            # OWNER mode: show user and group
-            owner_parts = entry.display_owner.split(":", 1)
-            size_text = truncate(owner_parts[0] if len(owner_parts) > 0 else "-", size_width)
-            modified_text = truncate(owner_parts[1] if len(owner_parts) > 1 else "-", modified_width)
-        else:
-            # FILE and GIT modes: show size and modified
-            size_text = truncate(entry.display_size, size_width)
-            modified_text = truncate(entry.display_modified, modified_width)
-
-        stdscr.addnstr(y, name_x, name_text.ljust(name_width), name_width, name_attrs)
-        stdscr.addnstr(y, mode_x, mode_text.ljust(mode_width), mode_width, base_attrs)
-        # User column left-aligned in OWNER mode, size right-aligned in other modes
-        if mode is BrowserMode.OWNER:
-            stdscr.addnstr(y, size_x, size_text.ljust(size_width), size_width, base_attrs)
-        else:
-            stdscr.addnstr(y, size_x, size_text.rjust(size_width), size_width, base_attrs)
-        stdscr.addnstr(
-            y, modified_x, modified_text.ljust(modified_width), modified_width, base_attrs
-        )
+    # User column left-aligned in OWNER mode, size right-aligned in other modes
+    if mode is BrowserMode.OWNER:
+        size_text = size_text.ljust(size_width)
+    else:
+        size_text = size_text.rjust(size_width)
+    columns_text = " ".join(
+        (mode_text.ljust(mode_width), size_text, modified_text.ljust(modified_width))
+    )
+    # FILE, TREE and OWNER modes use file colors
+    color_attrs = get_git_color(entry) if mode is BrowserMode.GIT else get_file_color(entry)
+    return (
+        _as_curses_text(name_text.ljust(name_width)),
+        _as_curses_text(columns_text),
+        color_attrs,
+    )
+
+
+def _as_curses_text(text: str) -> Union[str, bytes]:
+    """Pre-encode ASCII text so curses can copy it without converting.
+
+    Cached rows are written every frame; handing curses ``bytes`` skips the
+    per-call ``str`` to ``wchar_t`` conversion.  Non-ASCII text stays ``str``
+    because curses counts ``bytes`` lengths in bytes, not screen cells.
+    """
+    if text.isascii():
+        return text.encode("ascii")
+    return text
 
 
 def render_command_area(
@@ -357,6 +387,10 @@ def render_command_area(
     if available_rows > 0:
         # Show most recent messages
         console_lines = browser.console_buffer[-available_rows:] if browser.console_buffer else []
+        running = browser.running_command
+        if running is not None:
+            # Show output of a still-running command as it streams in
+            console_lines = (console_lines + running.snapshot())[-available_rows:]
         for offset in range(available_rows):
             y = start_y + offset
             if offset < len(console_lines):
@@ -8,6 +8,7 @@ contributors to experiment with :mod:`curses`.
 from __future__ import annotations
 
 import curses
+from functools import lru_cache
 from typing import Tuple
 
 # Box drawing characters
@@ -19,6 +20,7 @@ BOX_HORIZONTAL = "─"
 BOX_VERTICAL = "│"
 
 
+@lru_cache(maxsize=16)
 def determine_column_widths(interior_width: int) -> Tuple[int, int, int, int]:
     """Compute dynamic column widths for the browser panes."""
     min_col_width = 4
@@ -78,9 +80,12 @@ def draw_frame(
         stdscr.addch(bottom, left, BOX_BOTTOM_LEFT, attr)
         stdscr.addch(bottom, right, BOX_BOTTOM_RIGHT, attr)
 
-        for x_axis in range(left + 1, right):
-            stdscr.addch(top, x_axis, BOX_HORIZONTAL, attr)
-            stdscr.addch(bottom, x_axis, BOX_HORIZONTAL, attr)
+        # Horizontal runs go out as one string each.  ``hline`` would do the
+        # same in C but only accepts single-byte characters, not "─".
+        horizontal = BOX_HORIZONTAL * (right - left - 1)
+        if horizontal:
+            stdscr.addstr(top, left + 1, horizontal, attr)
+            stdscr.addstr(bottom, left + 1, horizontal, attr)
 
         for y_axis in range(top + 1, bottom):
             stdscr.addch(y_axis, left, BOX_VERTICAL, attr)
@@ -112,10 +117,11 @@ def draw_frame_title(
 
 def truncate(text: str, max_width: int) -> str:
     """Truncate text to fit within max_width, appending ellipsis if needed."""
-    if max_width <= 0:
-        return ""
+    # Most cells already fit; hand back the same object without copying.
     if len(text) <= max_width:
         return text
+    if max_width <= 0:
+        return ""
     if max_width <= 3:
         return text[:max_width]
     return text[: max_width - 3] + "..."
@@ -123,10 +129,10 @@ def truncate(text: str, max_width: int) -> str:
 
 def truncate_end(text: str, max_width: int) -> str:
     """Truncate text from the end to fit within max_width."""
-    if max_width <= 0:
-        return ""
     if len(text) <= max_width:
         return text
+    if max_width <= 0:
+        return ""
     return text[-max_width:]
 
 
@@ -18,10 +18,15 @@ import grp
 import os
 import pwd
 import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path, PurePosixPath
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
 
 from nedok.formatting import format_size, format_timestamp
 from nedok.git_status import collect_git_status
@@ -33,14 +38,54 @@ class PaneStateError(Exception):
     """Raised when pane state operations fail."""
 
 
+# Panes hold thousands of entries; ``__slots__`` drops the per-instance
+# ``__dict__`` and speeds up attribute access.  ``slots=`` needs Python 3.10.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ``os.scandir`` accepts a directory descriptor on most POSIX platforms.
+_SCANDIR_ACCEPTS_FD = os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+
+# Directory listing cache
+# -----------------------
+# Hopping back and forth between a handful of directories (Enter, Backspace,
+# switching modes) would otherwise rescan and re-stat every entry on each
+# visit.  Listings are remembered per directory together with the directory's
+# ``st_mtime_ns`` and reused for as long as that timestamp is unchanged.
+LISTING_CACHE_MAX_ENTRIES = 64
+# Filesystem timestamps are coarse, so a change made in the same tick as our
+# scan may not move the mtime.  Directories modified this recently are
+# therefore never cached.
+LISTING_CACHE_MIN_AGE_NS = 1_000_000_000
+
+_listing_cache: "OrderedDict[Path, Tuple[int, List[_PaneEntry]]]" = OrderedDict()
+# Both panes may refresh at the same time (see DualPaneBrowser._refresh_panes).
+_listing_cache_lock = threading.Lock()
+
+
+def invalidate_listing_cache(*directories: Union[Path, str]) -> None:
+    """Forget cached listings for ``directories``, or all of them if none given."""
+    with _listing_cache_lock:
+        if not directories:
+            _listing_cache.clear()
+            return
+        for directory in directories:
+            _listing_cache.pop(Path(directory), None)
+
+
+@lru_cache(maxsize=256)
 def _get_owner_name(uid: int) -> str:
-    """Convert UID to username, fallback to UID string."""
+    """Convert UID to username, fallback to UID string.
+
+    Cached because a listing usually repeats the same few owners and each
+    ``getpwuid`` call may hit NSS (files, LDAP, ...).
+    """
     try:
         return pwd.getpwuid(uid).pw_name
     except (KeyError, AttributeError):
         return str(uid)
 
 
+@lru_cache(maxsize=256)
 def _get_group_name(gid: int) -> str:
     """Convert GID to group name, fallback to GID string."""
     try:
@@ -49,7 +94,7 @@ def _get_group_name(gid: int) -> str:
         return str(gid)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class _PaneEntry:
     """A single row that can be rendered in a browser pane."""
     path: Union[Path, str]  # Path for local, str for remote
@@ -69,18 +114,36 @@ class _PaneEntry:
     tree_parent_path: Optional[Path] = None
     tree_is_collapsed: bool = False
     tree_is_expanded: bool = False
+    # Formatted text, filled in on first use (see the display_* properties)
+    _display_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _display_size: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _display_modified: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _resolved_path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def resolved_path(self) -> Path:
+        """Return the canonical local path, resolving it on first use.
+
+        Raises ``OSError`` like :meth:`Path.resolve` when resolution fails.
+        """
+        if self._resolved_path is None:
+            self._resolved_path = Path(self.path).resolve()
+        return self._resolved_path
 
     @property
     def display_name(self) -> str:
         """Return the text shown for the entry."""
-        if self.is_parent:
-            return ".."
-        if self.is_remote:
-            name = PurePosixPath(str(self.path)).name
-        else:
-            name = Path(self.path).name or str(self.path)
-        suffix = "/" if self.is_dir else ""
-        return f"{name}{suffix}"
+        if self._display_name is None:
+            if self.is_parent:
+                self._display_name = ".."
+            else:
+                if self.is_remote:
+                    name = PurePosixPath(str(self.path)).name
+                else:
+                    name = Path(self.path).name or str(self.path)
+                suffix = "/" if self.is_dir else ""
+                self._display_name = f"{name}{suffix}"
+        return self._display_name
 
     @property
     def display_mode(self) -> str:
@@ -90,16 +153,19 @@ class _PaneEntry:
     @property
     def display_size(self) -> str:
         """Return a printable size string."""
-        if self.size is None:
-            return "-"
-        return format_size(self.size)
+        if self._display_size is None:
+            self._display_size = "-" if self.size is None else format_size(self.size)
+        return self._display_size
 
     @property
     def display_modified(self) -> str:
         """Return a printable modified timestamp."""
-        if self.modified is None:
-            return "-"
-        return format_timestamp(self.modified)
+        if self._display_modified is None:
+            if self.modified is None:
+                self._display_modified = "-"
+            else:
+                self._display_modified = format_timestamp(self.modified)
+        return self._display_modified
 
     @property
     def display_owner(self) -> str:
@@ -109,7 +175,7 @@ class _PaneEntry:
         return f"{self.owner_user}:{self.owner_group}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class _PaneState:
     """Mutable state for a single pane (left or right)."""
     current_dir: Union[Path, str]  # Path for local, str for remote
@@ -119,6 +185,13 @@ class _PaneState:
     ssh_connection: Optional[SSHConnection] = None
     tree_mode_enabled: bool = False
     tree_collapsed_paths: Set[Path] = field(default_factory=set)
+    _row_cache_key: Optional[Hashable] = field(default=None, repr=False, compare=False)
+    _row_cache: Dict[int, Any] = field(default_factory=dict, repr=False, compare=False)
+    _title_cache: Optional[Tuple[Hashable, str]] = field(default=None, repr=False, compare=False)
+    # mtime of the listed local directory when `entries` was read
+    _listed_mtime_ns: Optional[int] = field(default=None, repr=False, compare=False)
+    # Directory `entries` was read from, to tell a rescan from a navigation
+    _entries_dir: Optional[Union[Path, str]] = field(default=None, repr=False, compare=False)
 
     @property
     def is_remote(self) -> bool:
@@ -132,28 +205,79 @@ class _PaneState:
             return f"{self.ssh_connection}:{self.current_dir}"
         return str(self.current_dir)
 
+    def frame_title(self, width: int) -> str:
+        """Return the directory title cut and padded to exactly `width` cells.
+
+        The result is reused until the directory, connection or width changes,
+        so steady-state frames skip the string building entirely.
+        """
+        key = (self.current_dir, self.ssh_connection, self.is_remote, width)
+        cached = self._title_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        title = self.current_dir_display
+        if len(title) > width:
+            title = title[-width:] if width > 0 else ""
+        text = title.ljust(width)
+        self._title_cache = (key, text)
+        return text
+
+    def row_cache_for(self, layout_key: Hashable) -> Dict[int, Any]:
+        """Return the renderer's per-row text cache for `layout_key`.
+
+        The cache is emptied whenever the entries are refreshed or the
+        renderer asks for a different layout (mode or column widths).
+        """
+        if layout_key != self._row_cache_key:
+            self._row_cache_key = layout_key
+            self._row_cache.clear()
+        return self._row_cache
+
     def refresh_entries(self, mode: BrowserMode) -> None:
-        """Populate `entries` with directory contents."""
+        """Populate `entries` with directory contents.
+
+        When the same directory is read again, the cursor stays on the entry
+        it was on rather than on the same row number, so files appearing or
+        disappearing elsewhere do not move the selection to another item.
+        """
+        selected = self.selected_entry() if self.current_dir == self._entries_dir else None
+        self._row_cache.clear()
+        self._listed_mtime_ns = None
         if self.tree_mode_enabled and not self.is_remote and mode is BrowserMode.TREE:
             self._refresh_tree_entries()
-            return
-        if self.is_remote:
+        elif self.is_remote:
             self._refresh_remote_entries(mode)
         else:
             self._refresh_local_entries(mode)
+        self._entries_dir = self.current_dir
+        if selected is not None:
+            self._reselect(selected)
+
+    def _reselect(self, previous: _PaneEntry) -> None:
+        """Move the cursor back to the entry matching ``previous``, if present."""
+        entries = self.entries
+        index = self.cursor_index
+        if index < len(entries) and entries[index].path == previous.path:
+            return
+        for index, entry in enumerate(entries):
+            if entry.path == previous.path and entry.is_parent == previous.is_parent:
+                self.cursor_index = index
+                return
 
     def _refresh_local_entries(self, mode: BrowserMode) -> None:
         """Populate entries from local directory."""
         items: List[_PaneEntry] = []
         current = Path(self.current_dir)
 
-        if current != current.parent:
-            items.append(self._build_entry(current.parent, is_parent=True))
+        # Compare plain strings rather than building and comparing a second
+        # Path; dirname() of the filesystem root is the root itself.
+        current_str = os.fspath(current)
+        parent_str = os.path.dirname(current_str)
+        if parent_str != current_str:
+            items.append(self._build_entry(Path(parent_str), is_parent=True))
 
         try:
-            candidates: Iterable[Path] = sorted(
-                current.iterdir(), key=self._sort_key
-            )
+            children = self._scan_local_directory(current)
         except PermissionError as err:
             raise PermissionError(
                 f"Permission denied reading directory: {current}"
@@ -163,8 +287,7 @@ class _PaneState:
                 f"Directory not found: {current}"
             ) from err
 
-        for entry in candidates:
-            items.append(self._build_entry(entry))
+        items.extend(children)
 
         if mode is BrowserMode.GIT:
             self._attach_git_status(items)
@@ -173,6 +296,56 @@ class _PaneState:
         self.cursor_index = min(self.cursor_index, max(len(self.entries) - 1, 0))
         self.scroll_offset = min(self.scroll_offset, max(len(self.entries) - 1, 0))
 
+    def _scan_local_directory(self, current: Path) -> List[_PaneEntry]:
+        """Return the sorted entries of ``current``, reusing a cached listing.
+
+        The returned list may be shared with the cache (and with the other pane
+        when both show the same directory), so callers must not modify it.
+        """
+        mtime_ns = os.stat(current).st_mtime_ns
+        self._listed_mtime_ns = mtime_ns
+        with _listing_cache_lock:
+            cached = _listing_cache.get(current)
+            if cached is not None and cached[0] == mtime_ns:
+                _listing_cache.move_to_end(current)
+                return cached[1]
+
+        entries = self._scan_sorted(current)
+
+        with _listing_cache_lock:
+            if time.time_ns() - mtime_ns >= LISTING_CACHE_MIN_AGE_NS:
+                _listing_cache[current] = (mtime_ns, entries)
+                _listing_cache.move_to_end(current)
+                while len(_listing_cache) > LISTING_CACHE_MAX_ENTRIES:
+                    _listing_cache.popitem(last=False)
+            else:
+                _listing_cache.pop(current, None)
+        return entries
+
+    def _scan_sorted(self, directory: Path) -> List[_PaneEntry]:
+        """Scan ``directory`` and build its entries in display order.
+
+        Where the platform allows it the directory is opened once and scanned
+        through that descriptor, so every per-entry ``stat`` is an ``fstatat``
+        relative to it instead of a lookup that walks the full path again.
+        """
+        if not _SCANDIR_ACCEPTS_FD:
+            with os.scandir(directory) as iterator:
+                candidates: List[os.DirEntry] = sorted(iterator, key=self._sort_key)
+            return [self._build_entry(candidate) for candidate in candidates]
+
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(dir_fd) as iterator:
+                candidates = sorted(iterator, key=self._sort_key)
+            # DirEntry.stat() uses dir_fd lazily, so it must stay open here.
+            return [
+                self._build_entry(candidate, directory=directory)
+                for candidate in candidates
+            ]
+        finally:
+            os.close(dir_fd)
+
     def _refresh_remote_entries(self, mode: BrowserMode) -> None:
         """Populate entries from remote directory via SSH."""
         if not self.is_remote or not self.ssh_connection:
@@ -228,12 +401,12 @@ class _PaneState:
                 visited_dirs.add(normalized_dir)
 
             try:
-                children = sorted(directory.iterdir(), key=self._sort_key)
+                children = self._scan_sorted(directory)
             except (PermissionError, FileNotFoundError, NotADirectoryError, OSError):
                 return
 
-            for child in children:
-                entry = self._build_entry(child)
+            for entry in children:
+                child = entry.path
                 entry.tree_depth = depth
                 entry.tree_parent_path = directory
                 normalized_child = self._normalize_tree_path(child)
@@ -280,21 +453,66 @@ class _PaneState:
         self.tree_collapsed_paths = filtered
 
     @staticmethod
-    def _sort_key(path: Path) -> Tuple[int, str]:
-        """Directories come first, then files alphabetically."""
+    def _sort_key(path: Union[Path, os.DirEntry]) -> Tuple[int, str]:
+        """Directories come first, then files alphabetically.
+
+        ``os.DirEntry`` answers ``is_dir()`` from the cached directory listing,
+        so sorting a freshly scanned directory does not stat every entry.
+        """
         try:
             is_dir = path.is_dir()
         except OSError:
             is_dir = False
         return (0 if is_dir else 1, path.name.lower())
 
-    def move_cursor(self, delta: int) -> None:
-        """Move cursor by `delta` steps."""
+    def move_cursor(self, delta: int) -> bool:
+        """Move cursor by `delta` steps; return True if it moved."""
         if not self.entries:
             self.cursor_index = 0
             self.scroll_offset = 0
-            return
+            return False
+        previous = self.cursor_index
         self.cursor_index = max(0, min(self.cursor_index + delta, len(self.entries) - 1))
+        return self.cursor_index != previous
+
+    def listing_is_stale(self) -> bool:
+        """Return True if the listed local directory changed since it was read.
+
+        Only plain local listings are tracked; tree views and remote panes
+        always report False.
+        """
+        if self._listed_mtime_ns is None:
+            return False
+        try:
+            return os.stat(self.current_dir).st_mtime_ns != self._listed_mtime_ns
+        except OSError:
+            return True
+
+    def remove_entry(self, path: Union[Path, str]) -> bool:
+        """Drop the row for ``path`` without rescanning the directory.
+
+        Returns False if no row shows ``path``.  The cached listing of the
+        directory is discarded so the next refresh does not bring it back.
+        """
+        for index, entry in enumerate(self.entries):
+            if entry.path == path and not entry.is_parent:
+                break
+        else:
+            return False
+        del self.entries[index]
+        self._row_cache.clear()
+        if not self.is_remote:
+            invalidate_listing_cache(self.current_dir)
+            if self._listed_mtime_ns is not None:
+                # Our own change should not look like an outside one.
+                try:
+                    self._listed_mtime_ns = os.stat(self.current_dir).st_mtime_ns
+                except OSError:
+                    self._listed_mtime_ns = None
+        if self.cursor_index > index:
+            self.cursor_index -= 1
+        self.cursor_index = min(self.cursor_index, max(len(self.entries) - 1, 0))
+        return True
 
     def ensure_cursor_visible(self, viewport_height: int) -> None:
         """Adjust scroll offset so cursor is visible."""
@@ -364,8 +582,13 @@ class _PaneState:
         if entry.is_dir:
             if self.is_remote:
                 self.current_dir = str(entry.path)
+            elif entry.is_symlink:
+                self.current_dir = entry.resolved_path
             else:
-                self.current_dir = Path(entry.path).resolve()
+                # Entries are built by joining the (already normalised)
+                # current directory with a name, so only symlinks need the
+                # per-component lstat walk that resolve() performs.
+                self.current_dir = Path(entry.path)
             self.cursor_index = 0
             self.scroll_offset = 0
             if self.tree_mode_enabled:
@@ -387,9 +610,27 @@ class _PaneState:
         if self.tree_mode_enabled:
             self.tree_collapsed_paths.clear()
 
-    def _build_entry(self, path: Path, *, is_parent: bool = False) -> _PaneEntry:
-        """Construct a pane entry for the given path."""
-        stat_info = self._stat_or_none(path)
+    def _build_entry(
+        self,
+        source: Union[Path, os.DirEntry],
+        *,
+        is_parent: bool = False,
+        directory: Optional[Path] = None,
+    ) -> _PaneEntry:
+        """Construct a pane entry for the given path or directory entry.
+
+        Passing the ``os.DirEntry`` produced by :func:`os.scandir` lets us reuse
+        the information the kernel already returned while listing the
+        directory instead of looking every name up again.  Entries from a
+        descriptor-based scan only know their name, so ``directory`` supplies
+        the path they live in.
+        """
+        if isinstance(source, os.DirEntry):
+            path = directory / source.name if directory is not None else Path(source.path)
+            stat_info = self._dir_entry_stat_or_none(source)
+        else:
+            path = source
+            stat_info = self._stat_or_none(path)
         is_dir = self._is_dir(path, stat_info)
         mode = stat.filemode(stat_info.st_mode) if stat_info else ""
         size: Optional[int] = None
@@ -405,9 +646,12 @@ class _PaneState:
             if not stat.S_ISDIR(stat_info.st_mode):
                 size = stat_info.st_size
 
-            # Check if file is a symlink
+            # Check if file is a symlink (scandir already knows from d_type)
             try:
-                is_symlink = path.is_symlink()
+                if isinstance(source, os.DirEntry):
+                    is_symlink = source.is_symlink()
+                else:
+                    is_symlink = path.is_symlink()
             except OSError:
                 pass
 
@@ -506,6 +750,14 @@ class _PaneState:
         except OSError:
             return None
 
+    @staticmethod
+    def _dir_entry_stat_or_none(entry: os.DirEntry) -> Optional[os.stat_result]:
+        """Return (cached) stat information for a scandir entry, or None."""
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
     @staticmethod
     def _is_dir(path: Path, stat_info: Optional[os.stat_result]) -> bool:
         """Determine whether the path refers to a directory."""
@@ -520,27 +772,25 @@ class _PaneState:
         """Populate git status for entries when in git mode."""
         if not entries:
             return
+        # Entries can come from the listing cache, so clear any status left
+        # over from an earlier visit before applying the fresh one.
+        for entry in entries:
+            entry.git_status = None
         repo_root, status_map = collect_git_status(self.current_dir)
         if not status_map or repo_root is None:
             return
-        repo_root = repo_root.resolve()
-        normalized_map: Dict[Path, str] = {}
-        for abs_path, status in status_map.items():
-            try:
-                normalized = abs_path.resolve()
-            except OSError:
-                continue
-            normalized_map[normalized] = status
-
+        # Status keys sit below the canonical top level, so each entry is
+        # looked up by its canonical parent plus its own name.  Resolving the
+        # parent once per directory (one for a flat listing) replaces a
+        # resolve() per entry and per status line; a symlink is matched by
+        # its own status rather than its target's.
+        canonical_parents: Dict[Path, Path] = {}
         for entry in entries:
-            try:
-                resolved_path = entry.path.resolve()
-            except OSError:
-                continue
-            status = normalized_map.get(resolved_path)
-            if status is None and entry.is_dir:
-                status = normalized_map.get(resolved_path / "")
-            entry.git_status = status
+            path = Path(entry.path)
+            parent = canonical_parents.get(path.parent)
+            if parent is None:
+                parent = canonical_parents[path.parent] = Path(os.path.realpath(path.parent))
+            entry.git_status = status_map.get(parent / path.name)
 
 
-__all__ = ["_PaneEntry", "_PaneState", "PaneStateError"]
+__all__ = ["_PaneEntry", "_PaneState", "PaneStateError", "invalidate_listing_cache"]
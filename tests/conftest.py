@@ -0,0 +1,20 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture
+def age_mtime() -> Callable[..., None]:
+    """Return a helper that backdates mtimes so mtime-keyed caches trust them."""
+
+    def age(*paths: Path) -> None:
+        old = time.time() - 60
+        for path in paths:
+            os.utime(path, (old, old))
+
+    return age
@@ -3,7 +3,11 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+import pytest
+
+from nedok import git_operations
 from nedok.browser import DualPaneBrowser
+from nedok.input_handlers import _BackgroundTask
 from nedok.modes import BrowserMode
 
 
@@ -75,3 +79,154 @@ def test_git_mode_stage_unstage_restore(tmp_path):
     status_after_restore = _run(["git", "status", "--porcelain"], cwd=repo).stdout.splitlines()
     assert status_after_restore == []
     assert tracked.read_text(encoding="utf-8") == "initial\n"
+
+
+def test_git_log_runs_in_background(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "user.name", "Tester"], cwd=repo)
+    tracked = repo / "tracked.txt"
+    tracked.write_text("initial\n", encoding="utf-8")
+    _run(["git", "add", "tracked.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "first change"], cwd=repo)
+
+    browser = DualPaneBrowser(repo, repo)
+    browser.mode = BrowserMode.GIT
+    shown = []
+    browser._show_in_pager = lambda text, suffix, description: shown.append(text)
+
+    _select_entry(browser, tracked)
+    browser._git_log_entry()
+    task = browser.background_task
+    assert task is not None
+    assert browser.status_message == "Git log running..."
+
+    # A second request waits for the first to finish
+    browser._git_blame_entry()
+    assert browser.background_task is task
+
+    task.future.result(timeout=10)
+    assert browser._poll_background_task()
+    assert browser.background_task is None
+    assert len(shown) == 1 and b"first change" in shown[0]
+
+
+def test_finished_background_task_waits_for_open_prompt(tmp_path):
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    shown = []
+    task = _BackgroundTask(description="Git log", on_done=shown.append)
+    task.start(lambda: b"log")
+    browser.background_task = task
+    task.future.result(timeout=10)
+
+    browser.in_rename_mode = True
+    assert not browser._poll_background_task()
+    assert browser.background_task is task
+    assert shown == []
+
+    browser.in_rename_mode = False
+    assert browser._poll_background_task()
+    assert browser.background_task is None
+    assert shown == [b"log"]
+
+
+def test_show_in_pager_leaves_no_file_behind(tmp_path):
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser._pager = "/usr/bin/less"
+    browser._pager_args = ("-R",)
+    seen = []
+
+    def fake_external(command, **kwargs):
+        seen.append((command[:2], Path(command[-1]).read_text(encoding="utf-8"), command[-1]))
+
+    browser._run_external = fake_external
+    browser._show_in_pager(b"diff --git a b\n", ".diff", "Git diff")
+
+    assert seen[0][0] == ["/usr/bin/less", "-R"]
+    assert seen[0][1] == "diff --git a b\n"
+    assert not Path(seen[0][2]).exists()
+
+
+def test_show_in_pager_uses_temp_file_without_proc(tmp_path, monkeypatch):
+    with monkeypatch.context() as patched:
+        patched.setattr(git_operations.os.path, "isdir", lambda path: False)
+        assert not git_operations._memfd_pager_available()
+
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    monkeypatch.setattr(git_operations, "_memfd_pager_available", lambda: False)
+    seen = []
+
+    def fake_external(command, **kwargs):
+        seen.append(command[-1])
+
+    browser._run_external = fake_external
+    browser._show_in_pager(b"log\n", ".log", "Git log")
+
+    assert len(seen) == 1
+    assert not seen[0].startswith("/proc/")
+    assert seen[0].endswith(".log")
+
+
+def _recording_pager(browser):
+    seen = []
+
+    def fake_external(command, **kwargs):
+        seen.append((command[-1], Path(command[-1]).read_bytes()))
+
+    browser._run_external = fake_external
+    return seen
+
+
+def test_show_in_pager_runs_pager_once_from_memfd(tmp_path):
+    if not git_operations._memfd_pager_available():
+        pytest.skip("memfd pager path not available here")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    seen = _recording_pager(browser)
+
+    browser._show_in_pager(b"blame\n", ".blame", "Git blame")
+
+    assert len(seen) == 1
+    assert seen[0][0].startswith("/proc/")
+    assert seen[0][1] == b"blame\n"
+
+
+def test_show_in_pager_uses_temp_file_when_memfd_fails(tmp_path, monkeypatch):
+    if not git_operations._memfd_pager_available():
+        pytest.skip("memfd pager path not available here")
+
+    def refuse(*args):
+        raise OSError("no memfd")
+
+    monkeypatch.setattr(git_operations.os, "memfd_create", refuse)
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    seen = _recording_pager(browser)
+
+    browser._show_in_pager(b"log\n", ".log", "Git log")
+
+    assert len(seen) == 1
+    assert not seen[0][0].startswith("/proc/")
+    assert seen[0][1] == b"log\n"
+    assert not Path(seen[0][0]).exists()
+
+
+def test_show_in_pager_uses_temp_file_when_proc_path_unreadable(tmp_path, monkeypatch):
+    if not git_operations._memfd_pager_available():
+        pytest.skip("memfd pager path not available here")
+    real_open = git_operations.os.open
+
+    def open_without_proc(path, *args, **kwargs):
+        if str(path).startswith("/proc/"):
+            raise PermissionError(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(git_operations.os, "open", open_without_proc)
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    seen = _recording_pager(browser)
+
+    browser._show_in_pager(b"diff\n", ".diff", "Git diff")
+
+    assert len(seen) == 1
+    assert not seen[0][0].startswith("/proc/")
+    assert seen[0][1] == b"diff\n"
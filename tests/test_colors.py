@@ -211,3 +211,24 @@ def test_color_pair_enum_values():
     assert ColorPair.GIT_RENAMED == 14
     assert ColorPair.GIT_CLEAN == 15
     assert ColorPair.DIALOG == 20
+
+
+def test_init_colors_precomputes_pair_attributes():
+    """After init_colors the helpers return precomputed pair attributes."""
+    from nedok import colors
+
+    with patch('curses.has_colors', return_value=True), \
+            patch('curses.start_color'), \
+            patch('curses.use_default_colors'), \
+            patch('curses.init_pair'), \
+            patch('curses.color_pair', side_effect=lambda pair: int(pair) << 8):
+        colors.init_colors()
+    try:
+        with patch('curses.has_colors', side_effect=AssertionError):
+            assert get_file_color(_make_entry(is_dir=True)) == (1 << 8) | curses.A_BOLD
+            assert get_file_color(_make_entry(is_symlink=True)) == 3 << 8
+            assert get_git_color(_make_entry(git_status=" M")) == 11 << 8
+            assert get_git_color(_make_entry(git_status="??")) == (10 << 8) | curses.A_BOLD
+    finally:
+        with patch('curses.has_colors', return_value=False):
+            colors.init_colors()
@@ -308,3 +308,25 @@ def test_corrupted_config_file_returns_defaults(tmp_path):
 
     finally:
         config.CONFIG_FILE = original_config_file
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """An unchanged config file is parsed once; edits are picked up."""
+    monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "cached.toml")
+    save_ssh_credentials("first.host", "alice")
+
+    parses = []
+    real_loads = config.tomllib.loads
+
+    def counting_loads(text):
+        parses.append(text)
+        return real_loads(text)
+
+    monkeypatch.setattr(config.tomllib, "loads", counting_loads)
+    first = load_config()
+    first["ssh"]["credentials"].clear()
+    assert get_ssh_credentials("first.host") == {"username": "alice"}
+    assert len(parses) == 1
+
+    save_ssh_credentials("second.host", "bob")
+    assert get_ssh_credentials("second.host") == {"username": "bob"}
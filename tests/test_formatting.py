@@ -10,6 +10,14 @@ def test_format_size_scales_units():
     assert format_size(1048576) == "1M"
 
 
+def test_format_size_rounds_to_one_decimal():
+    assert format_size(0) == "0B"
+    assert format_size(1023) == "1023B"
+    assert format_size(2000) == "2K"
+    assert format_size(1048575) == "1024K"
+    assert format_size(5 * 1024**3 + 300 * 1024**2) == "5.3G"
+
+
 def test_format_timestamp_short_format():
     timestamp = datetime(2024, 1, 2, 13, 45)
     assert format_timestamp(timestamp) == "Jan 02 13:45"
@@ -1,7 +1,9 @@
+import os
 import subprocess
 from pathlib import Path
 
-from nedok.git_status import collect_git_status
+from nedok import git_status
+from nedok.git_status import collect_git_status, find_repo_root, git_status_batch, run_git
 
 
 def test_collect_git_status_outside_repo(tmp_path: Path):
@@ -65,3 +67,102 @@ def test_collect_git_status_handles_quoted_paths(tmp_path: Path):
     assert root == repo.resolve()
     key = spaced.resolve()
     assert status_map[key] == "??"
+
+
+def test_find_repo_root_is_cached_per_directory(tmp_path: Path, monkeypatch, age_mtime):
+    repo = tmp_path / "repo"
+    (repo / "sub").mkdir(parents=True)
+    _setup_repo(repo)
+    age_mtime(repo / "sub", repo)
+
+    assert find_repo_root(repo / "sub") == repo.resolve()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("git should not be launched")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    assert find_repo_root(repo / "sub") == repo.resolve()
+
+
+def test_find_repo_root_seeds_parent_directories(tmp_path: Path, monkeypatch, age_mtime):
+    repo = (tmp_path / "repo").resolve()
+    (repo / "a" / "b").mkdir(parents=True)
+    _setup_repo(repo)
+    age_mtime(repo / "a" / "b", repo / "a", repo)
+
+    assert find_repo_root(repo / "a" / "b") == repo
+
+    def fail(*args, **kwargs):
+        raise AssertionError("git should not be launched")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    assert find_repo_root(repo / "a") == repo
+    assert find_repo_root(repo) == repo
+
+
+def test_find_repo_root_notices_new_repository(tmp_path: Path, age_mtime):
+    project = tmp_path / "project"
+    project.mkdir()
+    age_mtime(project)
+    assert find_repo_root(project) is None
+
+    _setup_repo(project)
+    assert find_repo_root(project) == project.resolve()
+
+
+def test_git_status_batch_runs_status_once_per_repository(tmp_path: Path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "sub").mkdir(parents=True)
+    _setup_repo(repo)
+    (repo / "sub" / "new.txt").write_text("data\n", encoding="utf-8")
+
+    calls = []
+    real_popen = subprocess.Popen
+
+    def counting_popen(args, **kwargs):
+        if "status" in args:
+            calls.append(args)
+        return real_popen(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", counting_popen)
+    with git_status_batch():
+        _, from_root = collect_git_status(repo)
+        _, from_sub = collect_git_status(repo / "sub")
+    assert len(calls) == 1
+    assert from_root == from_sub
+    assert from_sub[(repo / "sub").resolve()] == "??"
+
+    collect_git_status(repo)
+    assert len(calls) == 2
+
+
+def test_run_git_uses_absolute_executable_without_closing_fds(tmp_path: Path, monkeypatch):
+    seen = {}
+    real_run = subprocess.run
+
+    def recording_run(args, **kwargs):
+        seen["args"] = args
+        seen["close_fds"] = kwargs.get("close_fds")
+        seen["env"] = kwargs.get("env")
+        return real_run(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+    result = run_git(["-C", str(tmp_path), "--version"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert os.path.isabs(seen["args"][0])
+    assert seen["close_fds"] is False
+    assert seen["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+
+
+def test_status_records_are_parsed_across_read_chunks(tmp_path: Path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _setup_repo(repo)
+    names = [f"untracked-{index:03d}.txt" for index in range(20)]
+    for name in names:
+        (repo / name).write_text("data\n", encoding="utf-8")
+
+    monkeypatch.setattr(git_status, "STATUS_READ_CHUNK", 7)
+    _, status_map = collect_git_status(repo)
+    for name in names:
+        assert status_map[(repo / name).resolve()] == "??"
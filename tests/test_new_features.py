@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import curses
+import errno
+import io
+import os
+import shutil
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
-from nedok.browser import DualPaneBrowser
+import pytest
+
+from nedok import input_handlers
+from nedok.browser import OUTPUT_BUFFER_MAX_LINES, DualPaneBrowser
+from nedok.file_operations import _FileCloner
+from nedok.input_handlers import _direct_argv
 from nedok.modes import BrowserMode
+from nedok.state import _PaneState
 
 
 def test_delete_requires_confirmation(tmp_path: Path) -> None:
@@ -211,6 +224,25 @@ def test_confirmation_key_handler(tmp_path: Path) -> None:
     assert not test_file.exists()
 
 
+def test_confirmation_swallows_other_keys(tmp_path: Path) -> None:
+    """Keys other than y/n keep the confirmation prompt untouched."""
+    (tmp_path / "keep.txt").write_text("content")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser._refresh_both_panes()
+    for idx, entry in enumerate(browser.left.entries):
+        if entry.path.name == "keep.txt":
+            browser.left.cursor_index = idx
+            break
+
+    browser._delete_entry()
+    prompt = browser.status_message
+    assert not browser._handle_confirmation_key(ord('x'))
+    assert not browser._dispatch_key(ord('x'))
+    assert browser._dispatch_key(curses.KEY_RESIZE)
+    assert browser.pending_action is not None
+    assert browser.status_message == prompt
+
+
 def test_refresh_active_pane(tmp_path: Path) -> None:
     """Test that refresh reloads directory contents."""
     browser = DualPaneBrowser(tmp_path, tmp_path)
@@ -295,3 +327,355 @@ def test_move_overwrite_confirmation(tmp_path: Path) -> None:
     assert browser.pending_action is None
     assert not source_file.exists()
     assert dest_file.read_text(encoding="utf-8") == "payload"
+
+
+def _wait_for_command(browser: DualPaneBrowser) -> None:
+    assert browser.running_command is not None
+    browser.running_command.reader.join(timeout=10)
+    assert browser._poll_running_command()
+    assert browser.running_command is None
+
+
+def test_execute_command_streams_output_to_console(tmp_path: Path) -> None:
+    """Console commands run in the background and report their exit code."""
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.command_buffer = "echo out; echo err >&2; exit 3"
+    browser._execute_command()
+    _wait_for_command(browser)
+
+    assert browser.console_buffer[-3:-1] == ["out", "err"]
+    assert "exited with code 3" in browser.console_buffer[-1]
+
+
+def test_execute_command_keeps_only_recent_output(tmp_path: Path) -> None:
+    """Large outputs are truncated while streaming, not after buffering."""
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.command_buffer = f"seq 1 {OUTPUT_BUFFER_MAX_LINES + 50}"
+    browser._execute_command()
+    running = browser.running_command
+    _wait_for_command(browser)
+
+    assert running.dropped_lines == 50
+    assert running.snapshot()[0] == "51"
+    assert browser.console_buffer[-2] == str(OUTPUT_BUFFER_MAX_LINES + 50)
+    assert len(browser.console_buffer) == OUTPUT_BUFFER_MAX_LINES
+
+
+def test_execute_command_runs_simple_commands_without_shell(tmp_path: Path) -> None:
+    """Plain commands skip /bin/sh; builtins still reach the shell."""
+    (tmp_path / "two  spaces").write_text("", encoding="utf-8")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.command_buffer = "ls 'two  spaces'"
+    browser._execute_command()
+    assert browser.running_command.process.args == ["ls", "two  spaces"]
+    _wait_for_command(browser)
+    assert browser.console_buffer[-2] == "two  spaces"
+
+    browser.command_buffer = "exit 4"
+    browser._execute_command()
+    _wait_for_command(browser)
+    assert "exited with code 4" in browser.console_buffer[-1]
+
+
+def test_execute_command_sends_shell_builtins_to_the_shell(tmp_path: Path) -> None:
+    """cd, export, echo and pwd keep their shell behaviour."""
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    for command in ("cd missing-dir", "export FOO=1", "echo -n x", "pwd"):
+        assert _direct_argv(command) is None
+
+    browser.command_buffer = "export FOO=1"
+    browser._execute_command()
+    assert browser.running_command.process.args == "export FOO=1"
+    _wait_for_command(browser)
+    assert browser.console_buffer[-1].endswith("exited with code 0.")
+
+    browser.command_buffer = "cd missing-dir"
+    browser._execute_command()
+    _wait_for_command(browser)
+    assert not browser.console_buffer[-1].endswith("exited with code 0.")
+
+    browser.command_buffer = "pwd"
+    browser._execute_command()
+    _wait_for_command(browser)
+    assert browser.console_buffer[-2].endswith(str(tmp_path))
+
+
+def test_running_command_reports_new_output_once(tmp_path: Path) -> None:
+    """Idle polls do not ask for a repaint when no output arrived."""
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.command_buffer = "echo hello"
+    browser._execute_command()
+    running = browser.running_command
+    running.reader.join(timeout=10)
+
+    assert running.take_new_output()
+    assert not running.take_new_output()
+    _wait_for_command(browser)
+
+
+def test_read_tail_keeps_last_lines_across_chunks(monkeypatch) -> None:
+    """Remote output is split on chunk boundaries and bounded while reading."""
+    monkeypatch.setattr(input_handlers, "REMOTE_READ_CHUNK", 3)
+    stream = io.BytesIO(b"one\r\ntwo\nthree\nfour")
+
+    lines, dropped = input_handlers._read_tail(stream, 2)
+
+    assert lines == ["three", "four"]
+    assert dropped == 2
+
+
+class _QueuedKeys:
+    """Minimal stand-in for a curses window with pre-queued input."""
+    def __init__(self, keys: list[int]) -> None:
+        self.keys = list(keys)
+
+    def timeout(self, delay: int) -> None:
+        pass
+
+    def getch(self) -> int:
+        return self.keys.pop(0) if self.keys else -1
+
+
+def test_queued_keys_are_applied_before_repaint(tmp_path: Path) -> None:
+    """A burst of cursor moves is handled in one go; 'q' stops the loop."""
+    for index in range(5):
+        (tmp_path / f"file{index}.txt").write_text("x", encoding="utf-8")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.left.refresh_entries(BrowserMode.FILE)
+
+    screen = _QueuedKeys([ord("j"), ord("j"), ord("j")])
+    assert browser._dispatch_queued_keys(screen)
+    assert browser.left.cursor_index == 3
+    assert screen.keys == []
+
+    screen = _QueuedKeys([ord("k"), ord("q"), ord("k")])
+    assert not browser._dispatch_queued_keys(screen)
+    assert browser.left.cursor_index == 2
+
+
+def test_keys_that_change_nothing_skip_the_repaint(tmp_path: Path) -> None:
+    """Only keys that changed something mark the frame dirty."""
+    (tmp_path / "only.txt").write_text("x", encoding="utf-8")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.left.refresh_entries(BrowserMode.FILE)
+    browser._dirty = False
+
+    # The cursor is already at the top; moving up again does nothing.
+    assert browser._dispatch_queued_keys(_QueuedKeys([ord("k")]))
+    assert not browser._dirty
+    assert browser.status_message is None
+
+    # An unknown key reports itself once, then stays quiet.
+    assert browser._dispatch_key(ord("Z"))
+    assert browser.status_message == "Unhandled keypress."
+    assert not browser._dispatch_key(ord("Z"))
+
+    browser.in_command_mode = True
+    assert not browser._dispatch_key(curses.KEY_UP)
+    assert browser._dispatch_key(ord("q"))
+    assert browser.command_buffer == "q"
+
+    browser.in_command_mode = False
+    assert browser._dispatch_queued_keys(_QueuedKeys([ord("j")]))
+    assert browser._dirty
+
+
+def test_refresh_both_panes_reuses_one_worker_thread(tmp_path: Path) -> None:
+    """The right pane is scanned on the same worker thread every time."""
+    (tmp_path / "left").mkdir()
+    (tmp_path / "right").mkdir()
+    browser = DualPaneBrowser(tmp_path / "left", tmp_path / "right")
+    threads = []
+    refresh_pane = browser._refresh_pane
+
+    def record(pane):
+        if pane is browser.right:
+            threads.append(threading.current_thread())
+        refresh_pane(pane)
+
+    browser._refresh_pane = record
+    browser._refresh_both_panes()
+    browser._refresh_both_panes()
+    assert len(threads) == 2
+    assert threads[0] is threads[1] is not threading.main_thread()
+
+
+def test_refresh_panes_skips_unaffected_pane(tmp_path: Path) -> None:
+    """Only panes that can show a changed path are rescanned."""
+    left_dir = tmp_path / "left"
+    right_dir = tmp_path / "right"
+    left_dir.mkdir()
+    right_dir.mkdir()
+    browser = DualPaneBrowser(left_dir, right_dir)
+
+    refreshed = []
+    original = _PaneState.refresh_entries
+
+    def record(pane, mode):
+        refreshed.append(pane)
+        original(pane, mode)
+
+    with patch.object(_PaneState, "refresh_entries", autospec=True, side_effect=record):
+        browser._refresh_panes(left_dir / "new.txt")
+        assert refreshed == [browser.left]
+
+        refreshed.clear()
+        browser._refresh_panes(tmp_path / "elsewhere" / "file.txt")
+        assert refreshed == []
+
+        # A pane whose directory was removed or renamed must refresh too
+        browser._refresh_panes(right_dir)
+        assert refreshed == [browser.right]
+
+        refreshed.clear()
+        browser._refresh_panes()
+        assert sorted(map(id, refreshed)) == sorted(map(id, [browser.left, browser.right]))
+
+
+def test_mode_prompt_selects_mode_by_initial(tmp_path: Path) -> None:
+    """Either case of a mode's initial selects it from the prompt."""
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.in_mode_prompt = True
+
+    assert browser._handle_mode_selection_key(ord("G"))
+    assert browser.mode is BrowserMode.GIT
+    assert not browser.in_mode_prompt
+
+    browser.in_mode_prompt = True
+    assert browser._handle_mode_selection_key(ord("o"))
+    assert browser.mode is BrowserMode.OWNER
+    assert not browser._handle_mode_selection_key(ord("z"))
+
+
+def test_file_cloner_copies_contents_and_metadata(tmp_path: Path) -> None:
+    """Reflink copies fall back to a byte copy where cloning is refused."""
+    source = tmp_path / "src"
+    (source / "nested").mkdir(parents=True)
+    script = source / "nested" / "run.sh"
+    script.write_text("#!/bin/sh\n", encoding="utf-8")
+    script.chmod(0o750)
+    os.utime(script, (1_000_000, 1_000_000))
+
+    shutil.copytree(source, tmp_path / "dst", copy_function=_FileCloner())
+
+    copied = tmp_path / "dst" / "nested" / "run.sh"
+    assert copied.read_text(encoding="utf-8") == "#!/bin/sh\n"
+    assert copied.stat().st_mode & 0o777 == 0o750
+    assert copied.stat().st_mtime == 1_000_000
+
+
+def test_file_cloner_leaves_special_files_to_copy2(tmp_path: Path) -> None:
+    """A FIFO source is rejected like shutil.copy2 does instead of blocking."""
+    fifo = tmp_path / "pipe"
+    os.mkfifo(fifo)
+    cloner = _FileCloner()
+    with pytest.raises(shutil.SpecialFileError):
+        cloner(str(fifo), str(tmp_path / "copy"))
+    assert cloner.enabled
+    assert not (tmp_path / "copy").exists()
+
+
+def test_move_renames_within_filesystem(tmp_path: Path) -> None:
+    """Local moves rename in place and copy only across filesystems."""
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    (src_dir / "tree").mkdir(parents=True)
+    (src_dir / "tree" / "file.txt").write_text("data", encoding="utf-8")
+    (src_dir / "other.txt").write_text("other", encoding="utf-8")
+    dst_dir.mkdir()
+
+    browser = DualPaneBrowser(src_dir, dst_dir)
+    browser.left.refresh_entries(BrowserMode.FILE)
+    browser.right.refresh_entries(BrowserMode.FILE)
+
+    _select_path_in_pane(browser, "left", src_dir / "tree")
+    with patch("shutil.copytree", side_effect=AssertionError("copied")):
+        browser._move_entry()
+    assert (dst_dir / "tree" / "file.txt").read_text(encoding="utf-8") == "data"
+    assert not (src_dir / "tree").exists()
+
+    _select_path_in_pane(browser, "left", src_dir / "other.txt")
+    with patch("os.replace", side_effect=OSError(errno.EXDEV, "cross-device")):
+        browser._move_entry()
+    assert (dst_dir / "other.txt").read_text(encoding="utf-8") == "other"
+    assert not (src_dir / "other.txt").exists()
+
+
+def test_delete_drops_row_without_rescan(tmp_path: Path) -> None:
+    """Deleting from a plain listing removes the row in place."""
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser.left.refresh_entries(BrowserMode.FILE)
+    browser.right.refresh_entries(BrowserMode.FILE)
+    _select_path_in_pane(browser, "left", tmp_path / "c.txt")
+    browser._delete_entry()
+
+    with patch.object(_PaneState, "refresh_entries", side_effect=AssertionError("rescanned")):
+        browser._handle_confirmation_key(ord("y"))
+
+    assert not (tmp_path / "c.txt").exists()
+    for pane in (browser.left, browser.right):
+        assert [entry.display_name for entry in pane.entries] == ["..", "a.txt", "b.txt"]
+    assert browser.left.cursor_index == 2
+
+
+def test_idle_revalidation_picks_up_outside_changes(tmp_path: Path) -> None:
+    """Directories changed by other programs are rescanned when idle."""
+    left_dir = tmp_path / "left"
+    right_dir = tmp_path / "right"
+    left_dir.mkdir()
+    right_dir.mkdir()
+    browser = DualPaneBrowser(left_dir, right_dir)
+    browser.left.refresh_entries(BrowserMode.FILE)
+    browser.right.refresh_entries(BrowserMode.FILE)
+    assert not browser._revalidate_panes()
+
+    (left_dir / "new.txt").write_text("x", encoding="utf-8")
+    os.utime(left_dir, ns=(0, 12345))
+
+    assert browser.left.listing_is_stale()
+    assert not browser.right.listing_is_stale()
+    assert browser._revalidate_panes()
+    assert "new.txt" in [entry.display_name for entry in browser.left.entries]
+    assert not browser.left.listing_is_stale()
+
+
+def test_rename_targets_entry_chosen_before_outside_changes(tmp_path: Path) -> None:
+    """Files appearing during a rename prompt do not change its target."""
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    browser._refresh_both_panes()
+    for idx, entry in enumerate(browser.left.entries):
+        if entry.path.name == "b.txt":
+            browser.left.cursor_index = idx
+            break
+
+    browser._start_rename()
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    os.utime(tmp_path, ns=(0, 12345))
+    assert browser.left.listing_is_stale()
+    assert not browser._revalidate_panes()
+
+    # A rescan from elsewhere keeps the cursor on the same file.
+    browser.left.refresh_entries(BrowserMode.FILE)
+    assert browser.left.selected_entry().path.name == "b.txt"
+
+    browser.rename_buffer = "renamed.txt"
+    browser._execute_rename()
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "a"
+    assert (tmp_path / "renamed.txt").read_text(encoding="utf-8") == "b"
+    assert not (tmp_path / "b.txt").exists()
+
+
+def test_pager_and_editor_are_resolved_once(tmp_path: Path, monkeypatch) -> None:
+    """PATH lookups and the less -R decision happen at startup."""
+    monkeypatch.setenv("PAGER", "sh")
+    monkeypatch.setenv("EDITOR", "missing-editor-xyz")
+    browser = DualPaneBrowser(tmp_path, tmp_path)
+    assert browser._pager == shutil.which("sh")
+    assert browser._pager_args == ()
+    assert browser._editor == "missing-editor-xyz"
+
+    monkeypatch.setenv("PAGER", "missing-less-xyz")
+    assert DualPaneBrowser(tmp_path, tmp_path)._pager_args == ("-R",)
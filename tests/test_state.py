@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from nedok.state import _PaneEntry, _PaneState, _get_owner_name, _get_group_name
 from nedok.modes import BrowserMode
@@ -277,3 +278,107 @@ def test_pane_entry_symlink_detection(tmp_path):
         if entry.path == link:
             assert entry.is_symlink is True
             break
+
+
+def test_refresh_reuses_cached_listing(tmp_path, age_mtime):
+    """Unchanged directories are not rescanned on revisit."""
+    from nedok.state import invalidate_listing_cache
+
+    (tmp_path / "file.txt").write_text("test")
+    age_mtime(tmp_path)
+    invalidate_listing_cache()
+
+    state = _PaneState(current_dir=tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+    first = state.entries[1]
+
+    state.refresh_entries(BrowserMode.FILE)
+    assert state.entries[1] is first
+
+    invalidate_listing_cache(tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+    assert state.entries[1] is not first
+    assert state.entries[1].path == first.path
+
+
+def test_refresh_rescans_when_directory_changes(tmp_path, age_mtime):
+    """A changed directory mtime invalidates the cached listing."""
+    from nedok.state import invalidate_listing_cache
+
+    (tmp_path / "file.txt").write_text("test")
+    age_mtime(tmp_path)
+    invalidate_listing_cache()
+
+    state = _PaneState(current_dir=tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+    assert len(state.entries) == 2
+
+    (tmp_path / "other.txt").write_text("test")
+    state.refresh_entries(BrowserMode.FILE)
+    assert len(state.entries) == 3
+
+
+def test_row_cache_cleared_on_refresh_and_layout_change(tmp_path):
+    """Cached row text never outlives the entries or layout it was built for."""
+    (tmp_path / "file.txt").write_text("test")
+    state = _PaneState(current_dir=tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+
+    cache = state.row_cache_for(("layout", 1))
+    cache[0] = ("..", "")
+    assert state.row_cache_for(("layout", 1)) == {0: ("..", "")}
+    assert state.row_cache_for(("layout", 2)) == {}
+
+    state.row_cache_for(("layout", 2))[0] = ("..", "")
+    state.refresh_entries(BrowserMode.FILE)
+    assert state.row_cache_for(("layout", 2)) == {}
+
+
+def test_enter_selected_resolves_only_symlinks(tmp_path):
+    """Plain directories are entered as-is; symlinked ones are resolved."""
+    target = tmp_path / "target"
+    target.mkdir()
+    (tmp_path / "link").symlink_to(target)
+
+    state = _PaneState(current_dir=tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+    names = [entry.display_name for entry in state.entries]
+
+    state.cursor_index = names.index("link/")
+    state.enter_selected(BrowserMode.FILE)
+    assert state.current_dir == target.resolve()
+
+    state = _PaneState(current_dir=tmp_path)
+    state.refresh_entries(BrowserMode.FILE)
+    state.cursor_index = names.index("target/")
+    with patch.object(Path, "resolve", side_effect=AssertionError("resolved")):
+        state.enter_selected(BrowserMode.FILE)
+    assert state.current_dir == target
+
+
+def test_resolved_path_is_computed_once(tmp_path):
+    """Entries remember their canonical path after the first lookup."""
+    target = tmp_path / "target.txt"
+    target.write_text("x")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+    entry = _PaneEntry(path=link, is_dir=False, is_symlink=True)
+
+    expected = target.resolve()
+    assert entry.resolved_path == expected
+    with patch.object(Path, "resolve", side_effect=AssertionError("resolved")):
+        assert entry.resolved_path == expected
+
+
+def test_frame_title_is_cached_until_directory_changes(tmp_path):
+    """The padded pane title is rebuilt only when its inputs change."""
+    state = _PaneState(current_dir=tmp_path)
+    title = state.frame_title(80)
+    assert title == str(tmp_path).ljust(80)
+    assert state.frame_title(80) is title
+
+    short = state.frame_title(5)
+    assert short == str(tmp_path)[-5:]
+
+    state.current_dir = tmp_path / "child"
+    assert state.frame_title(80).rstrip() == str(tmp_path / "child")